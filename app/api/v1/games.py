@@ -1,33 +1,289 @@
-from fastapi import APIRouter, Query, HTTPException
+from datetime import datetime
+from typing import List, Optional, Set
+import asyncio
+import json
+from fastapi import APIRouter, Depends, Header, Query, HTTPException, Request, Response
+from fastapi.responses import JSONResponse
+from app.config import settings, GameDetailLevel
 from app.services.mlb_api import MLBAPIClient
 from app.cache.redis_manager import RedisManager
-from app.models.game import GameList
+from app.cache.compression import accepted_encodings, compress_variants
+from app.models.game import (
+    Game,
+    GameBatchRequest,
+    GameBatchResponse,
+    GameBatchResult,
+    GameList,
+    GameSummaries,
+)
 
 router = APIRouter()
-mlb_client = MLBAPIClient()
-redis_manager = RedisManager()
+
+# Game fields that need GUMBO enrichment or Gemini summaries to be filled in
+ENRICHED_FIELDS = {
+    "top_performer",
+    "winning_pitcher",
+    "losing_pitcher",
+    "save_pitcher",
+    "events",
+}
+SUMMARY_FIELDS = {"summary", "summary_pending"}
+
+
+def get_mlb_client(request: Request) -> MLBAPIClient:
+    """Clients are built in the app lifespan, not at import, to speed up cold starts."""
+    return request.app.state.mlb_client
+
+
+def get_redis_manager(request: Request) -> RedisManager:
+    return request.app.state.redis_manager
+
+
+def _cache_control(season: int, games: GameList) -> str:
+    """Completed seasons never change; the live season is only briefly fresh."""
+    if games.partial or any(game.partial for game in games.games):
+        return "no-store"
+    # Placeholder summaries are replaced once Gemini is retried
+    pending = any(game.summary_pending or game.summary_fallback for game in games.games)
+    if season < datetime.utcnow().year and not pending:
+        return f"public, max-age={settings.CACHE_CONTROL_COMPLETED_MAX_AGE}, immutable"
+    return f"public, max-age={settings.CACHE_CONTROL_LIVE_MAX_AGE}"
+
+
+def _etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """Weak comparison of an If-None-Match header against our ETag."""
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[Set[str]]:
+    if not fields:
+        return None
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested - {
+        name for name, field in Game.model_fields.items() if not field.exclude
+    }
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    return requested | {"id"}
+
+
+def _detail_level(
+    include: Optional[GameDetailLevel], fields: Optional[Set[str]]
+) -> GameDetailLevel:
+    """Use the requested level, or the cheapest one covering the requested fields."""
+    if include:
+        return include
+    if fields is None or fields & SUMMARY_FIELDS:
+        return GameDetailLevel.SUMMARIZED
+    if fields & ENRICHED_FIELDS:
+        return GameDetailLevel.ENRICHED
+    return GameDetailLevel.SCHEDULE
+
+
+def _response_etag(
+    season_etag: Optional[str],
+    games: GameList,
+    level: GameDetailLevel,
+    page: int,
+    per_page: int,
+    fields: Optional[Set[str]],
+) -> Optional[str]:
+    """Derive the page's ETag from the stored season ETag without re-serializing."""
+    if not season_etag:
+        return None
+    summaries = [(game.id, game.summary, game.summary_pending) for game in games.games]
+    return RedisManager.compute_etag(
+        json.dumps(
+            [season_etag, level.value, page, per_page, sorted(fields or []), summaries]
+        )
+    )
+
+
+def _response_cache_ttl(
+    season: int, games: GameList, etag: Optional[str]
+) -> Optional[int]:
+    """How long a serialized page may be replayed; None when it must not be stored."""
+    if _cache_control(season, games) == "no-store" or not etag:
+        return None
+    if any(game.summary_pending or game.summary_fallback for game in games.games):
+        return None
+    if season < datetime.utcnow().year:
+        return settings.CACHE_TTL
+    return settings.CACHE_CONTROL_LIVE_MAX_AGE
+
+
+def _encoded_response(body: bytes, encoding: str, headers: dict) -> Response:
+    headers = {**headers, "Vary": "Accept-Encoding"}
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("/games", response_model=GameList)
 async def get_games(
+    response: Response,
     season: int = Query(..., ge=2008, le=2024, description="Season year"),
     team_id: int = Query(..., description="Team ID to filter games"),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(10, ge=1, le=100, description="Items per page"),
+    include: Optional[GameDetailLevel] = Query(
+        None,
+        description="Detail level: schedule, enriched or summarized (default)",
+    ),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated game fields to return, e.g. teams,score,date"
+    ),
+    timeout_ms: Optional[int] = Query(
+        None,
+        ge=0,
+        description="Budget in ms (0 waits for all); late games come back flagged partial",
+    ),
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+    mlb_client: MLBAPIClient = Depends(get_mlb_client),
+    redis_manager: RedisManager = Depends(get_redis_manager),
 ):
     """Get all games for a given season and team ID with pagination."""
+    requested_fields = _parse_fields(fields)
+    level = _detail_level(include, requested_fields)
+    if requested_fields and level == GameDetailLevel.SUMMARIZED:
+        # Like id, always sent so a queued summary is not mistaken for none
+        requested_fields |= {"summary_pending"}
+    encodings = accepted_encodings(accept_encoding)
+    if settings.RESPONSE_CACHE_ENABLED:
+        # Replay the stored bytes of an identical earlier response, skipping pydantic
+        cached = await redis_manager.get_response(
+            season, team_id, level, page, per_page, requested_fields, encodings
+        )
+        if cached:
+            headers = {"Cache-Control": cached["cache_control"], "ETag": cached["etag"]}
+            if _etag_matches(if_none_match, cached["etag"]):
+                return Response(
+                    status_code=304, headers={**headers, "Vary": "Accept-Encoding"}
+                )
+            return _encoded_response(cached["body"], cached["encoding"], headers)
+
+    if timeout_ms is None:
+        timeout_ms = settings.REQUEST_DEADLINE_MS
+    deadline = None
+    if timeout_ms:
+        deadline = asyncio.get_running_loop().time() + timeout_ms / 1000
     try:
-        # Check Redis cache first
-        cached_games = await redis_manager.get_games(season, team_id)
-        if cached_games:
-            return cached_games
+        season_games, season_etag = await mlb_client.get_season_games(
+            season, team_id, level, deadline
+        )
+        games = mlb_client.paginate(season_games, page, per_page)
+        if level == GameDetailLevel.SUMMARIZED:
+            # Summaries are generated in the background; never wait on Gemini here
+            await mlb_client.attach_summaries(games.games)
 
-        # If not in cache, fetch from MLB API
-        games = await mlb_client.get_games(season, team_id, page, per_page)
+        headers = {"Cache-Control": _cache_control(season, games)}
+        etag = _response_etag(
+            season_etag, games, level, page, per_page, requested_fields
+        )
+        if etag:
+            headers["ETag"] = etag
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
 
-        # Cache results
-        await redis_manager.set_games(games, season, team_id)
+        projection = None
+        if requested_fields:
+            # Partial flags always survive projection so late data is never final
+            projection = {
+                "total_items": True,
+                "partial": True,
+                "games": {"__all__": requested_fields | {"partial"}},
+            }
 
+        ttl = _response_cache_ttl(season, games, etag)
+        if settings.RESPONSE_CACHE_ENABLED and ttl:
+            body = JSONResponse(
+                content=games.model_dump(mode="json", include=projection)
+            ).body
+            variants = await asyncio.to_thread(compress_variants, body)
+            await redis_manager.set_response(
+                season,
+                team_id,
+                level,
+                page,
+                per_page,
+                requested_fields,
+                variants,
+                etag,
+                headers["Cache-Control"],
+                ttl,
+            )
+            encoding = next(e for e in encodings if e in variants)
+            return _encoded_response(variants[encoding], encoding, headers)
+
+        if requested_fields:
+            return JSONResponse(
+                content=games.model_dump(mode="json", include=projection),
+                headers=headers,
+            )
+        response.headers.update(headers)
         return games
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/games:batch", response_model=GameBatchResponse)
+async def get_games_batch(
+    batch: GameBatchRequest,
+    mlb_client: MLBAPIClient = Depends(get_mlb_client),
+):
+    """Get one page of games for each requested season and team in a single call."""
+    timeout_ms = batch.timeout_ms
+    if timeout_ms is None:
+        timeout_ms = settings.REQUEST_DEADLINE_MS
+    deadline = None
+    if timeout_ms:
+        deadline = asyncio.get_running_loop().time() + timeout_ms / 1000
+    try:
+        combos = [(item.season, item.team_id) for item in batch.requests]
+        season_results = await mlb_client.get_many_season_games(
+            combos, batch.include, deadline
+        )
+        pages = [
+            mlb_client.paginate(season_games, batch.page, batch.per_page)
+            for season_games, _ in season_results
+        ]
+        if batch.include == GameDetailLevel.SUMMARIZED:
+            # One summary lookup for every page in the batch
+            await mlb_client.attach_summaries(
+                [game for page in pages for game in page.games]
+            )
+
+        return GameBatchResponse(
+            results=[
+                GameBatchResult(season=season, team_id=team_id, result=page)
+                for (season, team_id), page in zip(combos, pages)
+            ]
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/games/summaries", response_model=GameSummaries)
+async def get_game_summaries(
+    game_ids: List[int] = Query(..., description="Game IDs to poll summaries for"),
+    redis_manager: RedisManager = Depends(get_redis_manager),
+):
+    """Poll for summaries of games that were returned with summary_pending."""
+    try:
+        records = await redis_manager.get_summaries(game_ids)
+        return GameSummaries(
+            summaries={
+                game_id: record["summary"] for game_id, record in records.items()
+            },
+            pending=[game_id for game_id in game_ids if game_id not in records],
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
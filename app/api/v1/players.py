@@ -0,0 +1,40 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, HTTPException, Request
+from app.config import PlayerRole
+from app.cache.redis_manager import RedisManager
+from app.models.player import PlayerGame, PlayerGameList
+
+router = APIRouter()
+
+
+def get_redis_manager(request: Request) -> RedisManager:
+    return request.app.state.redis_manager
+
+
+@router.get("/players/{player_id}/games", response_model=PlayerGameList)
+async def get_player_games(
+    player_id: int,
+    season: Optional[int] = Query(None, ge=2008, description="Season year"),
+    role: Optional[PlayerRole] = Query(
+        None, description="Only games in this role, e.g. home_run"
+    ),
+    page: int = Query(1, ge=1, description="Page number"),
+    per_page: int = Query(10, ge=1, le=100, description="Items per page"),
+    redis_manager: RedisManager = Depends(get_redis_manager),
+):
+    """Get games featuring a player from the player index, newest first."""
+    try:
+        total_items, records = await redis_manager.get_player_games(
+            player_id,
+            season=season,
+            role=role.value if role else None,
+            offset=(page - 1) * per_page,
+            limit=per_page,
+        )
+        return PlayerGameList(
+            player_id=player_id,
+            total_items=total_items,
+            games=[PlayerGame(**record) for record in records],
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,53 @@
+"""Precompressed variants of cached response bodies and Accept-Encoding negotiation."""
+
+from typing import Dict, List, Optional
+import gzip
+import brotli
+
+# Preferred encodings first; identity is always available
+ENCODINGS = ["br", "gzip", "identity"]
+
+
+def compress_variants(body: bytes) -> Dict[str, bytes]:
+    """Encode a response body once per supported Content-Encoding."""
+    return {
+        "identity": body,
+        "gzip": gzip.compress(body, compresslevel=9, mtime=0),
+        "br": brotli.compress(body, mode=brotli.MODE_TEXT, quality=9),
+    }
+
+
+def accepted_encodings(accept_encoding: Optional[str]) -> List[str]:
+    """Return the encodings a client accepts, best first.
+
+    Encodings are ranked by the client's q-value; our order of preference
+    only breaks ties. ``*`` covers encodings not listed, and identity is
+    acceptable unless the client refuses it.
+    """
+    qualities = {}
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+
+    wildcard = qualities.get("*")
+    ranked = []
+    for encoding in ENCODINGS:
+        quality = qualities.get(encoding, wildcard)
+        if quality is None:
+            # Unlisted identity is always acceptable, but least preferred
+            quality = 0.001 if encoding == "identity" else 0.0
+        if quality > 0:
+            ranked.append((-quality, ENCODINGS.index(encoding), encoding))
+    # Never leave a client with nothing; identity is the safe fallback
+    return [encoding for _, _, encoding in sorted(ranked)] or ["identity"]
@@ -1,14 +1,21 @@
-from typing import Optional
-from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+from datetime import datetime, timezone
+import hashlib
 import json
 from redis import Redis
-from app.config import settings
-from app.models.game import GameList
+from app.config import settings, GameDetailLevel, PlayerRole
+from app.models.game import Game, GameList
+
+
+def player_game_score(date: str) -> float:
+    """Sorted-set score of a game in the player index: its UTC start time."""
+    return datetime.fromisoformat(date).replace(tzinfo=timezone.utc).timestamp()
 
 
 class RedisManager:
     _instance = None
     _redis: Optional[Redis] = None
+    _raw_redis: Optional[Redis] = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -26,31 +33,310 @@ class RedisManager:
                 decode_responses=True,
             )
 
-    async def get_games(self, season: int, team_id: int) -> Optional[GameList]:
-        """Retrieve games from cache based on season."""
-        cache_key = f"games:{season}-team:{team_id}"
-        data = self._redis.get(cache_key)
+    @property
+    def client(self) -> Redis:
+        return self._redis
 
-        if not data:
-            return None
+    @property
+    def raw_client(self) -> Redis:
+        """Client returning bytes, for compressed response bodies."""
+        if not self._raw_redis:
+            self._raw_redis = Redis(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                db=settings.REDIS_DB,
+                password=settings.REDIS_PASSWORD,
+                ssl=settings.REDIS_SSL,
+            )
+        return self._raw_redis
+
+    @staticmethod
+    def _games_key(season: int, team_id: int, tier: GameDetailLevel) -> str:
+        return f"games:{season}-team:{team_id}:{tier.value}"
+
+    @staticmethod
+    def compute_etag(payload: str) -> str:
+        """Build a strong ETag from the serialized cache payload."""
+        return '"' + hashlib.sha256(payload.encode("utf-8")).hexdigest() + '"'
+
+    @classmethod
+    def _games_etag(cls, game_list: dict) -> str:
+        """ETag of a serialized GameList, ignoring when it was cached.
+
+        Re-caching an unchanged season must keep its ETag so clients still
+        get 304s after each ``CACHE_TTL`` refresh.
+        """
+        content = {
+            **game_list,
+            "games": [
+                {k: v for k, v in game.items() if k != "cached_at"}
+                for game in game_list.get("games", [])
+            ],
+        }
+        return cls.compute_etag(json.dumps(content, default=str))
 
+    async def get_games_many(
+        self, keys: List[Tuple[int, int, GameDetailLevel]]
+    ) -> List[Tuple[Optional[GameList], Optional[str]]]:
+        """Retrieve several ``(season, team_id, tier)`` entries in one round trip."""
+        cache_keys = [self._games_key(*key) for key in keys]
         try:
-            game_data = json.loads(data)
-            return GameList(**game_data)
+            values = self._redis.mget(
+                [
+                    k
+                    for cache_key in cache_keys
+                    for k in (cache_key, f"{cache_key}:etag")
+                ]
+            )
         except Exception:
-            return None
+            return [(None, None)] * len(keys)
+
+        results = []
+        for data, etag in zip(values[::2], values[1::2]):
+            if not data:
+                results.append((None, None))
+                continue
+            try:
+                game_data = json.loads(data)
+                results.append(
+                    (GameList(**game_data), etag or self._games_etag(game_data))
+                )
+            except Exception:
+                results.append((None, None))
+        return results
 
-    async def set_games(self, games: GameList, season: int, team_id: int) -> bool:
-        """Store games in cache with the specified TTL."""
-        cache_key = f"games:{season}-team:{team_id}"
+    async def set_games(
+        self,
+        games: GameList,
+        season: int,
+        team_id: int,
+        tier: GameDetailLevel = GameDetailLevel.ENRICHED,
+    ) -> Optional[str]:
+        """Store games and their ETag in cache; returns the ETag on success."""
+        cache_key = self._games_key(season, team_id, tier)
         try:
             # Update cached_at timestamp for each game
             for game in games.games:
                 game.cached_at = datetime.utcnow()
 
-            # Store in Redis with TTL
-            return self._redis.setex(
-                cache_key, settings.CACHE_TTL, json.dumps(games.dict())
+            game_list = games.dict()
+            payload = json.dumps(game_list, default=str)
+            etag = self._games_etag(game_list)
+
+            # Store payload and ETag together so they expire at the same time
+            pipe = self._redis.pipeline()
+            pipe.setex(cache_key, settings.CACHE_TTL, payload)
+            pipe.setex(f"{cache_key}:etag", settings.CACHE_TTL, etag)
+            return etag if all(pipe.execute()) else None
+        except Exception:
+            return None
+
+    @staticmethod
+    def _summary_key(game_id: int) -> str:
+        return f"summary:{game_id}"
+
+    async def get_summaries(self, game_ids: List[int]) -> Dict[int, dict]:
+        """Retrieve stored summary records (summary plus fingerprint) by game ID."""
+        if not game_ids:
+            return {}
+        try:
+            values = self._redis.mget([self._summary_key(i) for i in game_ids])
+        except Exception:
+            return {}
+        return {
+            game_id: json.loads(value)
+            for game_id, value in zip(game_ids, values)
+            if value
+        }
+
+    async def set_summaries(
+        self,
+        games: List[Game],
+        summaries: Dict[int, Dict[str, str]],
+        ttl: Optional[int] = None,
+        fallback: bool = False,
+    ) -> bool:
+        """Store summaries per game, tagged with the facts they were written from.
+
+        ``fallback`` marks placeholder summaries, which are kept only until
+        Gemini is retried and must not be cached downstream as final.
+        """
+        try:
+            pipe = self._redis.pipeline()
+            for game in games:
+                if game.id not in summaries:
+                    continue
+                record = {
+                    "fingerprint": game.summary_fingerprint(),
+                    "summary": summaries[game.id],
+                    "fallback": fallback,
+                }
+                pipe.setex(
+                    self._summary_key(game.id),
+                    ttl or settings.SUMMARY_CACHE_TTL,
+                    json.dumps(record),
+                )
+            return all(pipe.execute())
+        except Exception:
+            return False
+
+    @staticmethod
+    def _player_games_key(player_id: int, role: Optional[str] = None) -> str:
+        if role:
+            return f"player:{player_id}:games:{role}"
+        return f"player:{player_id}:games"
+
+    async def index_player_lines(
+        self, game_id: int, season: int, date: datetime, lines: List[dict]
+    ) -> bool:
+        """Add a game's player stat lines to the player index.
+
+        Each player has a sorted set of game IDs scored by game time, one such
+        set per role, and a hash holding one record per game with every role
+        the player had and its stat line. Re-indexing a game overwrites its
+        records, so live games stay current.
+        """
+        if not lines:
+            return True
+        records = {}
+        for line in lines:
+            record = records.setdefault(
+                line["player_id"],
+                {
+                    "season": season,
+                    "game_id": game_id,
+                    "date": date.isoformat(),
+                    "roles": [],
+                    "player_name": line["player_name"],
+                    "stat_lines": {},
+                },
+            )
+            record["roles"].append(line["role"])
+            record["stat_lines"][line["role"]] = line["stat_line"]
+        try:
+            pipe = self._redis.pipeline()
+            for player_id, record in records.items():
+                self._index_player_game(pipe, player_id, record)
+            pipe.execute()
+            return True
+        except Exception:
+            return False
+
+    @classmethod
+    def _index_player_game(cls, pipe, player_id: int, record: dict):
+        """Queue the commands that store one player's record for one game."""
+        member = str(record["game_id"])
+        score = {member: player_game_score(record["date"])}
+        pipe.zadd(cls._player_games_key(player_id), score)
+        for role in PlayerRole:
+            # A live game can lose a role between refreshes
+            if role.value in record["roles"]:
+                pipe.zadd(cls._player_games_key(player_id, role.value), score)
+            else:
+                pipe.zrem(cls._player_games_key(player_id, role.value), member)
+        pipe.hset(f"player:{player_id}:lines", member, json.dumps(record))
+
+    async def get_player_games(
+        self,
+        player_id: int,
+        season: Optional[int] = None,
+        role: Optional[str] = None,
+        offset: int = 0,
+        limit: int = 10,
+    ) -> Tuple[int, List[dict]]:
+        """Return the total count and one page of a player's indexed games, newest first.
+
+        Paging happens in Redis, so the cost depends on the page size rather
+        than on the length of the player's career.
+        """
+        start, end = "+inf", "-inf"
+        if season is not None:
+            # Exclusive upper bound: Jan 1 of the next season belongs to it
+            next_season = datetime(season + 1, 1, 1, tzinfo=timezone.utc)
+            start = f"({next_season.timestamp()}"
+            end = datetime(season, 1, 1, tzinfo=timezone.utc).timestamp()
+        key = self._player_games_key(player_id, role)
+        try:
+            pipe = self._redis.pipeline()
+            pipe.zcount(key, end, start)
+            pipe.zrevrangebyscore(key, start, end, start=offset, num=limit)
+            total, page = pipe.execute()
+            if not page:
+                return total, []
+            values = self._redis.hmget(f"player:{player_id}:lines", page)
+            return total, [json.loads(value) for value in values if value]
+        except Exception:
+            return 0, []
+
+    @staticmethod
+    def _response_key(
+        season: int,
+        team_id: int,
+        level: GameDetailLevel,
+        page: int,
+        per_page: int,
+        fields: Optional[Set[str]],
+    ) -> str:
+        projection = ",".join(sorted(fields)) if fields else "*"
+        return (
+            f"response:{season}-team:{team_id}:{level.value}"
+            f":{page}:{per_page}:{projection}"
+        )
+
+    async def get_response(
+        self,
+        season: int,
+        team_id: int,
+        level: GameDetailLevel,
+        page: int,
+        per_page: int,
+        fields: Optional[Set[str]],
+        encodings: List[str],
+    ) -> Optional[dict]:
+        """Retrieve a serialized response in the first available accepted encoding."""
+        key = self._response_key(season, team_id, level, page, per_page, fields)
+        try:
+            etag, cache_control, *bodies = self.raw_client.hmget(
+                key, ["etag", "cache_control", *encodings]
+            )
+        except Exception:
+            return None
+        if not etag:
+            return None
+        for encoding, body in zip(encodings, bodies):
+            if body is not None:
+                return {
+                    "etag": etag.decode(),
+                    "cache_control": cache_control.decode(),
+                    "encoding": encoding,
+                    "body": body,
+                }
+        return None
+
+    async def set_response(
+        self,
+        season: int,
+        team_id: int,
+        level: GameDetailLevel,
+        page: int,
+        per_page: int,
+        fields: Optional[Set[str]],
+        variants: Dict[str, bytes],
+        etag: str,
+        cache_control: str,
+        ttl: int,
+    ) -> bool:
+        """Store every encoded variant of a response body with its headers."""
+        key = self._response_key(season, team_id, level, page, per_page, fields)
+        try:
+            pipe = self.raw_client.pipeline()
+            pipe.delete(key)
+            pipe.hset(
+                key,
+                mapping={"etag": etag, "cache_control": cache_control, **variants},
             )
+            pipe.expire(key, ttl)
+            pipe.execute()
+            return True
         except Exception:
             return False
@@ -0,0 +1,186 @@
+"""Per-season cache snapshots for warming a fresh Redis without upstream calls."""
+
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+import json
+import msgpack
+from app.config import GameDetailLevel
+from app.cache.redis_manager import RedisManager
+
+SNAPSHOT_VERSION = 3
+PIPELINE_CHUNK = 1000  # Commands per round trip when bulk loading
+
+
+def _chunks(items: List, size: int = PIPELINE_CHUNK) -> Iterable[List]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _ttl_ms(pttl: int) -> Optional[int]:
+    # PTTL is -1 for keys without an expiry
+    return pttl if pttl > 0 else None
+
+
+def _pttls(redis, keys: List[str]) -> List[int]:
+    pipe = redis.pipeline(transaction=False)
+    for key in keys:
+        pipe.pttl(key)
+    return pipe.execute()
+
+
+def export_player_lines(redis_manager: RedisManager) -> Dict[int, List[list]]:
+    """Read the whole player index once, grouped by season.
+
+    Returns ``{season: [[player_id, record], ...]}`` with one record per game.
+    """
+    redis = redis_manager.client
+    keys = list(redis.scan_iter(match="player:*:lines", count=PIPELINE_CHUNK))
+    by_season = defaultdict(list)
+    for chunk in _chunks(keys):
+        pipe = redis.pipeline(transaction=False)
+        for key in chunk:
+            pipe.hgetall(key)
+        for key, lines in zip(chunk, pipe.execute()):
+            player_id = int(key.split(":")[1])
+            for value in lines.values():
+                record = json.loads(value)
+                by_season[record["season"]].append([player_id, record])
+    return by_season
+
+
+def export_season(
+    redis_manager: RedisManager,
+    season: int,
+    player_lines: Optional[List[list]] = None,
+) -> dict:
+    """Collect a season's cached game lists, their summaries and player lines.
+
+    Each game list and summary carries its remaining ``ttl_ms`` so a restore
+    keeps short-lived entries short-lived. Partial game lists and placeholder
+    summaries stored after Gemini failures are left out, so they are fetched
+    and summarized again after import.
+    """
+    redis = redis_manager.client
+    tiers = {tier.value for tier in GameDetailLevel}
+    keys = [
+        key
+        for key in redis.scan_iter(match=f"games:{season}-team:*", count=PIPELINE_CHUNK)
+        if key.rsplit(":", 1)[-1] in tiers
+    ]
+
+    games = []
+    game_ids = set()
+    for chunk in _chunks(keys):
+        values = redis.mget([k for key in chunk for k in (key, f"{key}:etag")])
+        ttls = _pttls(redis, chunk)
+        for key, payload, etag, ttl in zip(chunk, values[::2], values[1::2], ttls):
+            if not payload:
+                continue
+            _, team, tier = key.rsplit(":", 2)
+            game_list = json.loads(payload)
+            if game_list.get("partial"):
+                # Missing GUMBO data must be re-fetched, not preserved
+                continue
+            game_ids.update(game["id"] for game in game_list["games"])
+            games.append(
+                {
+                    "team_id": int(team),
+                    "tier": tier,
+                    "etag": etag or RedisManager._games_etag(game_list),
+                    "ttl_ms": _ttl_ms(ttl),
+                    "games": game_list,
+                }
+            )
+
+    summaries = {}
+    ids = sorted(game_ids)
+    for chunk in _chunks(ids):
+        keys = [RedisManager._summary_key(i) for i in chunk]
+        values = redis.mget(keys)
+        ttls = _pttls(redis, keys)
+        for game_id, value, ttl in zip(chunk, values, ttls):
+            if not value:
+                continue
+            record = json.loads(value)
+            if record.get("fallback"):
+                continue
+            summaries[game_id] = {"record": record, "ttl_ms": _ttl_ms(ttl)}
+
+    return {
+        "version": SNAPSHOT_VERSION,
+        "season": season,
+        "exported_at": datetime.utcnow().isoformat(),
+        "games": games,
+        "summaries": summaries,
+        "players": player_lines or [],
+    }
+
+
+def import_snapshot(
+    redis_manager: RedisManager, snapshot: dict, ttl: Optional[int] = None
+) -> Dict[str, int]:
+    """Bulk-load a snapshot with pipelined writes; returns counts per section.
+
+    By default, summaries and current-season game lists keep the expiry they
+    had when exported. Game lists of completed seasons never change, so they
+    are kept until evicted rather than re-fetched after ``CACHE_TTL``.
+
+    ``ttl`` (seconds) overrides this for games and summaries; ``0`` keeps them
+    until evicted. The player index never expires, as in the app.
+    """
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version: {snapshot.get('version')}")
+    season = snapshot["season"]
+    completed = season < datetime.utcnow().year
+
+    def expiry(ttl_ms: Optional[int]) -> dict:
+        if ttl is not None:
+            return {"ex": ttl or None}
+        return {"px": ttl_ms}
+
+    # (command, args, kwargs) triples, sent PIPELINE_CHUNK at a time
+    commands = []
+    for entry in snapshot["games"]:
+        key = RedisManager._games_key(
+            season, entry["team_id"], GameDetailLevel(entry["tier"])
+        )
+        # Same serialization as set_games, so the stored ETag still matches
+        payload = json.dumps(entry["games"], default=str)
+        games_expiry = expiry(None if completed else entry["ttl_ms"])
+        commands.append(("set", (key, payload), games_expiry))
+        commands.append(("set", (f"{key}:etag", entry["etag"]), games_expiry))
+    for game_id, summary in snapshot["summaries"].items():
+        key = RedisManager._summary_key(game_id)
+        commands.append(
+            ("set", (key, json.dumps(summary["record"])), expiry(summary["ttl_ms"]))
+        )
+
+    redis = redis_manager.client
+    for chunk in _chunks(commands):
+        pipe = redis.pipeline(transaction=False)
+        for command, args, kwargs in chunk:
+            getattr(pipe, command)(*args, **kwargs)
+        pipe.execute()
+    for chunk in _chunks(snapshot["players"]):
+        pipe = redis.pipeline(transaction=False)
+        for player_id, record in chunk:
+            RedisManager._index_player_game(pipe, player_id, record)
+        pipe.execute()
+
+    return {
+        "games": len(snapshot["games"]),
+        "summaries": len(snapshot["summaries"]),
+        "players": len(snapshot["players"]),
+    }
+
+
+def write_snapshot(path: str, snapshot: dict):
+    with open(path, "wb") as f:
+        msgpack.pack(snapshot, f, use_bin_type=True)
+
+
+def read_snapshot(path: str) -> dict:
+    with open(path, "rb") as f:
+        # Summary maps are keyed by integer game IDs
+        return msgpack.unpack(f, raw=False, strict_map_key=False)
@@ -0,0 +1,96 @@
+"""Cache maintenance commands.
+
+Usage:
+    python -m app.cli export [SEASONS ...] [--dir snapshots]
+    python -m app.cli import FILE [FILE ...] [--ttl SECONDS]
+
+SEASONS are years or ranges such as ``2008-2024``; all seasons by default.
+"""
+
+from datetime import datetime
+from typing import List
+import argparse
+import os
+import time
+from app.config import settings
+from app.cache.redis_manager import RedisManager
+from app.cache import snapshot
+
+
+def parse_seasons(values: List[str]) -> List[int]:
+    if not values:
+        return list(range(settings.MLB_DATA_START_YEAR, datetime.utcnow().year + 1))
+    seasons = set()
+    for value in values:
+        first, _, last = value.partition("-")
+        seasons.update(range(int(first), int(last or first) + 1))
+    return sorted(seasons)
+
+
+def export_command(args):
+    redis_manager = RedisManager()
+    os.makedirs(args.dir, exist_ok=True)
+    # The player index is not keyed by season, so read it once for every file
+    player_lines = snapshot.export_player_lines(redis_manager)
+    for season in parse_seasons(args.seasons):
+        started = time.perf_counter()
+        data = snapshot.export_season(redis_manager, season, player_lines.get(season))
+        if not data["games"] and not data["players"]:
+            print(f"{season}: nothing cached, skipped")
+            continue
+        path = os.path.join(args.dir, f"season-{season}.msgpack")
+        snapshot.write_snapshot(path, data)
+        print(
+            f"{season}: {len(data['games'])} game lists, "
+            f"{len(data['summaries'])} summaries, {len(data['players'])} player games "
+            f"-> {path} ({os.path.getsize(path) / 1_000_000:.1f} MB, "
+            f"{time.perf_counter() - started:.1f}s)"
+        )
+
+
+def import_command(args):
+    redis_manager = RedisManager()
+    for path in args.files:
+        started = time.perf_counter()
+        data = snapshot.read_snapshot(path)
+        counts = snapshot.import_snapshot(redis_manager, data, args.ttl)
+        print(
+            f"{data['season']}: {counts['games']} game lists, "
+            f"{counts['summaries']} summaries, {counts['players']} player games "
+            f"<- {path} ({time.perf_counter() - started:.1f}s)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = commands.add_parser(
+        "export", help="Write one snapshot file per cached season"
+    )
+    export_parser.add_argument("seasons", nargs="*", help="Years or ranges")
+    export_parser.add_argument("--dir", default="snapshots", help="Output directory")
+    export_parser.set_defaults(func=export_command)
+
+    import_parser = commands.add_parser(
+        "import", help="Bulk-load snapshot files into the cache"
+    )
+    import_parser.add_argument("files", nargs="+", help="Snapshot files")
+    import_parser.add_argument(
+        "--ttl",
+        type=int,
+        default=None,
+        help="Expiry in seconds for games and summaries (0 never expires). "
+        "By default summaries and current-season games keep their exported "
+        "expiry and completed seasons never expire",
+    )
+    import_parser.set_defaults(func=import_command)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
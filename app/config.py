@@ -11,6 +11,21 @@ class MLBGameType(str, Enum):
     SPRING = "S"
 
 
+class PlayerRole(str, Enum):
+    BATTER = "batter"
+    HOME_RUN = "home_run"
+    PITCHER = "pitcher"
+    WINNING_PITCHER = "winning_pitcher"
+    LOSING_PITCHER = "losing_pitcher"
+    SAVE = "save"
+
+
+class GameDetailLevel(str, Enum):
+    SCHEDULE = "schedule"  # Schedule data only: teams, score, date, venue
+    ENRICHED = "enriched"  # Plus GUMBO data: top performer, winning pitcher, events
+    SUMMARIZED = "summarized"  # Plus Gemini summaries
+
+
 class Settings(BaseSettings):
     # API Configuration
     API_VERSION: str = "v1"
@@ -22,12 +37,21 @@ class Settings(BaseSettings):
     MLB_GUMBO_API_BASE_URL: str = "https://statsapi.mlb.com/api/v1.1"
     MLB_DATA_START_YEAR: int = 2008
     MLB_SPORT_ID: int = 1  # MLB = 1
+    MLB_API_CONCURRENCY: int = 10  # GUMBO fetches in flight per worker
 
-    # Google Cloud Configuration
-    GOOGLE_CLOUD_PROJECT: str
-    GOOGLE_CREDENTIALS_JSON: str
-    GOOGLE_GEMINI_API_KEY: str
-    GOOGLE_TRANSLATE_API_KEY: str
+    # Google Cloud Configuration (checked when the clients are first used)
+    GOOGLE_CLOUD_PROJECT: Optional[str] = None
+    GOOGLE_CREDENTIALS_JSON: Optional[str] = None
+    GOOGLE_GEMINI_API_KEY: Optional[str] = None
+    GOOGLE_TRANSLATE_API_KEY: Optional[str] = None
+
+    # Server Configuration
+    PORT: int = 8080
+    WEB_CONCURRENCY: Optional[int] = None  # Async workers; defaults to CPU count
+    PRELOAD_APP: bool = True  # Import shared modules once before forking workers
+    FEED_PROCESS_POOL_SIZE: int = 1  # Feed parsers per web worker; 0 parses inline
+
+    REQUEST_DEADLINE_MS: int = 5000  # Default /games budget; 0 waits for everything
 
     # Redis Configuration
     REDIS_HOST: str = "localhost"
@@ -38,6 +62,19 @@ class Settings(BaseSettings):
 
     # Cache Configuration
     CACHE_TTL: int = 600  # 10 minutes in seconds
+    RESPONSE_CACHE_ENABLED: bool = True  # Serve /games hits as stored gzip/br bytes
+
+    # Summary Queue Configuration
+    SUMMARY_QUEUE_BACKEND: str = "redis"  # "redis" (stream) or "memory"
+    SUMMARY_BATCH_SIZE: int = 5  # Games per Gemini request
+    SUMMARY_BATCH_LINGER_MS: int = 250  # Wait to fill a batch across requests
+    SUMMARY_WORKER_CONCURRENCY: int = 3  # Gemini batches in flight per worker
+    SUMMARY_JOB_TIMEOUT: int = 300  # Seconds before an unacknowledged job is retried
+    SUMMARY_CACHE_TTL: int = 2592000  # 30 days in seconds
+
+    # HTTP Caching Configuration
+    CACHE_CONTROL_COMPLETED_MAX_AGE: int = 31536000  # 1 year for past seasons
+    CACHE_CONTROL_LIVE_MAX_AGE: int = 60  # 1 minute for the current season
 
     class Config:
         env_file = ".env"
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional, List, Dict
 from pydantic import BaseModel, Field
-from app.config import MLBGameType
+from app.config import MLBGameType, GameDetailLevel
 
 
 class Team(BaseModel):
@@ -42,17 +42,47 @@ class Game(BaseModel):
     home_errors: Optional[int] = None
     top_performer: Optional[str] = None
     winning_pitcher: Optional[str] = None
+    losing_pitcher: Optional[str] = None
+    save_pitcher: Optional[str] = None
     summary: Optional[Dict[str, str]] = Field(
         default=None,
         description="Language code to summary mapping (e.g., {'en': 'English summary', 'es': 'Spanish summary', 'ja': 'Japanese summary'})",
     )
     events: Optional[List[GameEvent]] = None
     cached_at: Optional[datetime] = None
+    summary_pending: bool = Field(
+        default=False,
+        description="True while the summary is still being generated; poll /games/summaries",
+    )
+    summary_fallback: bool = Field(
+        default=False,
+        exclude=True,
+        description="True when the summary is a placeholder stored after Gemini failed",
+    )
+    partial: bool = Field(
+        default=False,
+        description="True when enrichment missed the request deadline or failed; retry for full data",
+    )
+
+    def summary_fingerprint(self) -> str:
+        """Facts a summary depends on; a stored summary is stale once they change."""
+        return "-".join(
+            str(fact)
+            for fact in (
+                self.score.away,
+                self.score.home,
+                self.winning_pitcher,
+                self.losing_pitcher,
+                self.save_pitcher,
+                self.status.is_final,
+            )
+        )
 
 
 class GameList(BaseModel):
     total_items: int
     games: List[Game]
+    partial: bool = False
 
     @classmethod
     def model_validate(cls, obj):
@@ -80,6 +110,8 @@ class GameList(BaseModel):
                                     "summary",
                                     "events",
                                     "cached_at",
+                                    "summary_pending",
+                                    "partial",
                                 ],
                                 game
                                 if isinstance(game, tuple)
@@ -94,3 +126,33 @@ class GameList(BaseModel):
                     for game in obj["games"]
                 ]
         return super().model_validate(obj)
+
+
+class GameSummaries(BaseModel):
+    summaries: Dict[int, Dict[str, str]]
+    pending: List[int]
+
+
+class GameBatchItem(BaseModel):
+    season: int = Field(..., ge=2008, le=2024, description="Season year")
+    team_id: int = Field(..., description="Team ID to filter games")
+
+
+class GameBatchRequest(BaseModel):
+    requests: List[GameBatchItem] = Field(..., min_length=1, max_length=50)
+    page: int = Field(1, ge=1, description="Page number")
+    per_page: int = Field(10, ge=1, le=100, description="Items per page")
+    include: GameDetailLevel = GameDetailLevel.SUMMARIZED
+    timeout_ms: Optional[int] = Field(
+        None, ge=0, description="Budget in ms (0 waits for all)"
+    )
+
+
+class GameBatchResult(BaseModel):
+    season: int
+    team_id: int
+    result: GameList
+
+
+class GameBatchResponse(BaseModel):
+    results: List[GameBatchResult]
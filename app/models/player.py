@@ -0,0 +1,19 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel
+from app.config import PlayerRole
+
+
+class PlayerGame(BaseModel):
+    season: int
+    game_id: int
+    date: datetime
+    roles: List[PlayerRole]
+    player_name: Optional[str] = None
+    stat_lines: Dict[PlayerRole, Dict[str, Any]]
+
+
+class PlayerGameList(BaseModel):
+    player_id: int
+    total_items: int
+    games: List[PlayerGame]
@@ -0,0 +1,188 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+import asyncio
+import os
+import socket
+import time
+from redis import Redis
+from redis.exceptions import ResponseError
+from app.config import settings
+from app.cache.redis_manager import RedisManager
+from app.models.game import Game
+
+# A job is the stream entry (or in-memory) id plus the game to summarize
+SummaryJob = Tuple[str, Game]
+
+
+class SummaryJobQueue(ABC):
+    """Queue of games waiting for a Gemini summary."""
+
+    @abstractmethod
+    async def enqueue(self, games: List[Game]) -> int:
+        """Queue games that are not already waiting; returns how many were added."""
+
+    @abstractmethod
+    async def dequeue_batch(
+        self, max_items: int, linger_ms: int = 0, block_ms: int = 1000
+    ) -> List[SummaryJob]:
+        """Wait up to ``block_ms`` for a job, then up to ``linger_ms`` to fill a batch."""
+
+    @abstractmethod
+    async def ack(self, jobs: List[SummaryJob]):
+        """Mark jobs as done so their games can be queued again later."""
+
+    @abstractmethod
+    async def release(self, jobs: List[SummaryJob]):
+        """Give up on jobs that failed so their games are not stuck as queued."""
+
+
+class InMemorySummaryQueue(SummaryJobQueue):
+    """Process-local queue for tests and single-process development."""
+
+    def __init__(self):
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._queued = set()
+
+    async def enqueue(self, games: List[Game]) -> int:
+        added = 0
+        for game in games:
+            if game.id in self._queued:
+                continue
+            self._queued.add(game.id)
+            self._queue.put_nowait((str(game.id), game))
+            added += 1
+        return added
+
+    async def dequeue_batch(
+        self, max_items: int, linger_ms: int = 0, block_ms: int = 1000
+    ) -> List[SummaryJob]:
+        try:
+            jobs = [await asyncio.wait_for(self._queue.get(), block_ms / 1000)]
+        except asyncio.TimeoutError:
+            return []
+
+        deadline = time.monotonic() + linger_ms / 1000
+        while len(jobs) < max_items:
+            if not self._queue.empty():
+                jobs.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                jobs.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return jobs
+
+    async def ack(self, jobs: List[SummaryJob]):
+        for _, game in jobs:
+            self._queued.discard(game.id)
+
+    async def release(self, jobs: List[SummaryJob]):
+        # The jobs are gone from the queue; the next request queues them again
+        await self.ack(jobs)
+
+
+class RedisStreamSummaryQueue(SummaryJobQueue):
+    """Durable queue on a Redis stream shared by every worker process.
+
+    Jobs stay pending in the consumer group until acknowledged, so work claimed
+    by a worker that dies is reclaimed by another after ``SUMMARY_JOB_TIMEOUT``.
+    """
+
+    stream = "summary:jobs"
+    group = "summary-workers"
+
+    def __init__(self, redis: Redis):
+        self._redis = redis
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
+        self._group_ready = False
+
+    @staticmethod
+    def _queued_key(game_id: int) -> str:
+        return f"summary:{game_id}:queued"
+
+    def _ensure_group(self):
+        if self._group_ready:
+            return
+        try:
+            self._redis.xgroup_create(self.stream, self.group, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._group_ready = True
+
+    async def enqueue(self, games: List[Game]) -> int:
+        # Claim a short-lived marker per game so concurrent requests queue it once
+        pipe = self._redis.pipeline()
+        for game in games:
+            pipe.set(
+                self._queued_key(game.id), 1, nx=True, ex=settings.SUMMARY_JOB_TIMEOUT
+            )
+        claimed = [game for game, ok in zip(games, pipe.execute()) if ok]
+
+        if claimed:
+            pipe = self._redis.pipeline()
+            for game in claimed:
+                pipe.xadd(self.stream, {"game": game.model_dump_json()})
+            pipe.execute()
+        return len(claimed)
+
+    def _read(self, count: int, block_ms: Optional[int]) -> List[SummaryJob]:
+        self._ensure_group()
+        # Reclaim jobs left unacknowledged by a crashed or stuck worker first
+        _, entries, *_ = self._redis.xautoclaim(
+            self.stream,
+            self.group,
+            self.consumer,
+            min_idle_time=settings.SUMMARY_JOB_TIMEOUT * 1000,
+            count=count,
+        )
+        if not entries:
+            response = self._redis.xreadgroup(
+                self.group,
+                self.consumer,
+                {self.stream: ">"},
+                count=count,
+                block=block_ms,
+            )
+            entries = response[0][1] if response else []
+        return [
+            (entry_id, Game.model_validate_json(fields["game"]))
+            for entry_id, fields in entries
+            if fields
+        ]
+
+    async def dequeue_batch(
+        self, max_items: int, linger_ms: int = 0, block_ms: int = 1000
+    ) -> List[SummaryJob]:
+        # Blocking reads run in a thread so they never stall the event loop
+        jobs = await asyncio.to_thread(self._read, max_items, block_ms)
+        if jobs and len(jobs) < max_items and linger_ms:
+            await asyncio.sleep(linger_ms / 1000)
+            jobs += await asyncio.to_thread(self._read, max_items - len(jobs), None)
+        return jobs
+
+    async def ack(self, jobs: List[SummaryJob]):
+        if not jobs:
+            return
+        pipe = self._redis.pipeline()
+        pipe.xack(self.stream, self.group, *[entry_id for entry_id, _ in jobs])
+        pipe.xdel(self.stream, *[entry_id for entry_id, _ in jobs])
+        pipe.delete(*[self._queued_key(game.id) for _, game in jobs])
+        pipe.execute()
+
+    async def release(self, jobs: List[SummaryJob]):
+        # Unacknowledged entries stay pending and are reclaimed by a worker
+        # after SUMMARY_JOB_TIMEOUT, when their queued markers also expire
+        pass
+
+
+def create_summary_queue() -> SummaryJobQueue:
+    """Build the queue selected by ``SUMMARY_QUEUE_BACKEND``."""
+    if settings.SUMMARY_QUEUE_BACKEND == "memory":
+        return InMemorySummaryQueue()
+    if settings.SUMMARY_QUEUE_BACKEND == "redis":
+        return RedisStreamSummaryQueue(RedisManager().client)
+    raise ValueError(f"Unknown SUMMARY_QUEUE_BACKEND: {settings.SUMMARY_QUEUE_BACKEND}")
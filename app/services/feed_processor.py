@@ -0,0 +1,303 @@
+"""CPU-bound GUMBO feed decoding, run in a process pool on raw response bytes."""
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional
+import asyncio
+import json
+import multiprocessing
+from app.config import settings
+
+_feed_pool: Optional[Executor] = None
+
+
+def get_feed_pool() -> Optional[Executor]:
+    """Create the process pool on first use so it is never forked by gunicorn.
+
+    Every web worker has its own pool, so the pool stays small by default;
+    workers times pool size should not exceed the CPUs actually available.
+    """
+    global _feed_pool
+    if settings.FEED_PROCESS_POOL_SIZE <= 0:
+        return None
+    if _feed_pool is None:
+        # The web worker already runs threads, which fork() would not copy safely
+        _feed_pool = ProcessPoolExecutor(
+            max_workers=settings.FEED_PROCESS_POOL_SIZE,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+    return _feed_pool
+
+
+def shutdown_feed_pool():
+    global _feed_pool
+    if _feed_pool is not None:
+        _feed_pool.shutdown(wait=False, cancel_futures=True)
+        _feed_pool = None
+
+
+async def run_in_feed_pool(func, *args):
+    """Run ``func`` in the feed process pool, or inline when it is disabled."""
+    pool = get_feed_pool()
+    if pool is None:
+        return func(*args)
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(pool, func, *args)
+    except BrokenProcessPool:
+        # One dead child (e.g. OOM on a huge feed) fails every later call on
+        # the pool, so replace it and retry once on the fresh one
+        if _feed_pool is pool:
+            shutdown_feed_pool()
+        return await loop.run_in_executor(get_feed_pool(), func, *args)
+
+
+def play_to_event(play: dict) -> Optional[dict]:
+    """Turn a completed scoring or extra-base play into an event."""
+    if play.get("about", {}).get("isComplete", False) and (
+        play.get("result", {}).get("rbi", 0) > 0
+        or play.get("result", {}).get("event") in ["Home Run", "Triple", "Double"]
+    ):
+        return {
+            "inning": str(play.get("about", {}).get("inning")),
+            "title": play.get("result", {}).get("event"),
+            "description": play.get("result", {}).get("description", ""),
+        }
+    return None
+
+
+def process_game_events(plays: dict) -> list:
+    """Process game events efficiently."""
+    try:
+        events = []
+        for play in plays.get("allPlays", []):
+            event = play_to_event(play)
+            if event:
+                events.append(event)
+        return events
+    except Exception as e:
+        print(f"Error processing game events: {str(e)}")
+        return []
+
+
+def get_top_performer(boxscore: dict) -> Optional[str]:
+    """Get top performer based on game stats."""
+    try:
+        top_performer = None
+        max_hits = 0
+        max_rbi = 0
+
+        for team_data in boxscore.get("teams", {}).values():
+            for player in team_data.get("players", {}).values():
+                batting_stats = player.get("stats", {}).get("batting", {})
+                hits = batting_stats.get("hits", 0)
+                rbi = batting_stats.get("rbi", 0)
+
+                if hits > max_hits or (hits == max_hits and rbi > max_rbi):
+                    max_hits = hits
+                    max_rbi = rbi
+                    top_performer = player.get("person", {}).get("fullName")
+
+        return top_performer
+    except Exception as e:
+        print(f"Error getting top performer: {str(e)}")
+        return None
+
+
+def extract_player_lines(feed: dict) -> List[dict]:
+    """Extract one stat line per player and role for the player index."""
+    live_data = feed.get("liveData", {})
+    lines = []
+    pitching_lines = {}
+
+    for team_data in live_data.get("boxscore", {}).get("teams", {}).values():
+        for player in team_data.get("players", {}).values():
+            person = player.get("person", {})
+            if not person.get("id"):
+                continue
+            entry = {"player_id": person["id"], "player_name": person.get("fullName")}
+
+            batting_stats = player.get("stats", {}).get("batting", {})
+            if batting_stats.get("plateAppearances", 0) > 0:
+                batting_line = {
+                    "at_bats": batting_stats.get("atBats", 0),
+                    "hits": batting_stats.get("hits", 0),
+                    "home_runs": batting_stats.get("homeRuns", 0),
+                    "rbi": batting_stats.get("rbi", 0),
+                    "walks": batting_stats.get("baseOnBalls", 0),
+                    "strikeouts": batting_stats.get("strikeOuts", 0),
+                }
+                lines.append({**entry, "role": "batter", "stat_line": batting_line})
+                if batting_line["home_runs"] > 0:
+                    lines.append(
+                        {**entry, "role": "home_run", "stat_line": batting_line}
+                    )
+
+            pitching_stats = player.get("stats", {}).get("pitching", {})
+            if pitching_stats.get("battersFaced", 0) > 0:
+                pitching_line = {
+                    "innings_pitched": pitching_stats.get("inningsPitched", "0.0"),
+                    "hits": pitching_stats.get("hits", 0),
+                    "earned_runs": pitching_stats.get("earnedRuns", 0),
+                    "walks": pitching_stats.get("baseOnBalls", 0),
+                    "strikeouts": pitching_stats.get("strikeOuts", 0),
+                }
+                pitching_lines[person["id"]] = pitching_line
+                lines.append({**entry, "role": "pitcher", "stat_line": pitching_line})
+
+    decisions = live_data.get("decisions", {})
+    for decision, role in (
+        ("winner", "winning_pitcher"),
+        ("loser", "losing_pitcher"),
+        ("save", "save"),
+    ):
+        pitcher = decisions.get(decision, {})
+        if pitcher.get("id"):
+            lines.append(
+                {
+                    "player_id": pitcher["id"],
+                    "player_name": pitcher.get("fullName"),
+                    "role": role,
+                    "stat_line": pitching_lines.get(pitcher["id"], {}),
+                }
+            )
+    return lines
+
+
+def get_decisions(live_data: dict) -> dict:
+    """Names of the pitchers credited with the win, loss and save."""
+    decisions = live_data.get("decisions", {})
+    return {
+        "winning_pitcher": decisions.get("winner", {}).get("fullName"),
+        "losing_pitcher": decisions.get("loser", {}).get("fullName"),
+        "save_pitcher": decisions.get("save", {}).get("fullName"),
+    }
+
+
+def extract_game_enrichment(feed: dict) -> dict:
+    """Extract the fields that enrich a scheduled game from a decoded feed."""
+    live_data = feed.get("liveData", {})
+    return {
+        **get_decisions(live_data),
+        "top_performer": get_top_performer(live_data.get("boxscore", {})),
+        "events": process_game_events(live_data.get("plays", {})),
+        "players": extract_player_lines(feed),
+    }
+
+
+def decode_game_enrichment(raw: bytes) -> dict:
+    """Decode a raw GUMBO feed and extract its enrichment fields."""
+    return extract_game_enrichment(json.loads(raw))
+
+
+def decode_game_stats(raw: bytes) -> Optional[dict]:
+    """Decode a raw GUMBO feed and extract statistics for recap generation."""
+    game_data = json.loads(raw)
+    try:
+        live_data = game_data.get("liveData", {})
+        linescore = live_data.get("linescore", {})
+        boxscore = live_data.get("boxscore", {})
+        plays = live_data.get("plays", {})
+        decisions = live_data.get("decisions", {})
+
+        # Extract team stats (batting and pitching)
+        team_stats = {}
+        for team_id, team_data in boxscore.get("teams", {}).items():
+            team_batting = team_data.get("teamStats", {}).get("batting", {})
+            team_pitching = team_data.get("teamStats", {}).get("pitching", {})
+
+            team_stats[team_id] = {
+                "batting": {
+                    "hits": team_batting.get("hits", 0),
+                    "runs": team_batting.get("runs", 0),
+                    "strikeouts": team_batting.get("strikeOuts", 0),
+                    "walks": team_batting.get("baseOnBalls", 0),
+                    "avg": team_batting.get("avg", ".000"),
+                    "batting_highlights": [],
+                },
+                "pitching": {
+                    "strikeouts": team_pitching.get("strikeOuts", 0),
+                    "walks": team_pitching.get("baseOnBalls", 0),
+                    "earned_runs": team_pitching.get("earnedRuns", 0),
+                    "era": team_pitching.get("era", "0.00"),
+                    "pitching_highlights": [],
+                },
+            }
+
+            # Process individual player stats
+            for player_id, player in team_data.get("players", {}).items():
+                # Batting highlights
+                batting_stats = player.get("stats", {}).get("batting", {})
+                if batting_stats.get("hits", 0) > 0:
+                    team_stats[team_id]["batting"]["batting_highlights"].append(
+                        {
+                            "player_name": player.get("person", {}).get("fullName", ""),
+                            "hits": batting_stats.get("hits", 0),
+                            "home_runs": batting_stats.get("homeRuns", 0),
+                            "rbi": batting_stats.get("rbi", 0),
+                            "avg": batting_stats.get("avg", ".000"),
+                        }
+                    )
+
+                # Pitching highlights
+                pitching_stats = player.get("stats", {}).get("pitching", {})
+                if pitching_stats.get("inningsPitched", 0) > 0:
+                    team_stats[team_id]["pitching"]["pitching_highlights"].append(
+                        {
+                            "player_name": player.get("person", {}).get("fullName", ""),
+                            "innings_pitched": pitching_stats.get(
+                                "inningsPitched", "0.0"
+                            ),
+                            "strikeouts": pitching_stats.get("strikeOuts", 0),
+                            "walks": pitching_stats.get("baseOnBalls", 0),
+                            "earned_runs": pitching_stats.get("earnedRuns", 0),
+                            "era": pitching_stats.get("era", "0.00"),
+                        }
+                    )
+
+        # Get key moments and plays
+        key_plays = []
+        for play in plays.get("allPlays", []):
+            if play.get("about", {}).get("isComplete", False) and (
+                play.get("result", {}).get("rbi", 0) > 0
+                or play.get("result", {}).get("event")
+                in ["Home Run", "Strikeout", "Walk"]
+            ):
+                key_plays.append(
+                    {
+                        "inning": play.get("about", {}).get("inning"),
+                        "half_inning": play.get("about", {}).get("halfInning"),
+                        "description": play.get("result", {}).get("description", ""),
+                        "rbi": play.get("result", {}).get("rbi", 0),
+                        "event": play.get("result", {}).get("event"),
+                        "batter": play.get("matchup", {})
+                        .get("batter", {})
+                        .get("fullName"),
+                        "pitcher": play.get("matchup", {})
+                        .get("pitcher", {})
+                        .get("fullName"),
+                    }
+                )
+
+        return {
+            "linescore": linescore,
+            "team_stats": team_stats,
+            "scoring_plays": plays.get("scoringPlays", []),
+            "key_plays": key_plays,
+            "home_runs": plays.get("homeRuns", []),
+            "decisions": {
+                "winner": decisions.get("winner", {}).get("fullName"),
+                "loser": decisions.get("loser", {}).get("fullName"),
+                "save": decisions.get("save", {}).get("fullName"),
+            },
+            "game_info": {
+                "venue": game_data.get("gameData", {}).get("venue", {}).get("name"),
+                "weather": game_data.get("gameData", {}).get("weather", {}),
+                "attendance": game_data.get("gameData", {}).get("attendance"),
+                "game_time": game_data.get("gameData", {})
+                .get("gameInfo", {})
+                .get("gameDurationMinutes"),
+            },
+        }
+    except (KeyError, AttributeError):
+        return None
@@ -1,23 +1,35 @@
-import google.generativeai as genai
-from app.models.game import GameList
+from typing import Dict, List
+from app.models.game import Game, GameList
 from app.config import settings
-from app.cache.redis_manager import RedisManager
 import json
 import asyncio
 
-genai.configure(api_key=settings.GOOGLE_GEMINI_API_KEY)
+
+def get_genai():
+    """Import and configure the Gemini SDK on first use to keep cold starts fast."""
+    import google.generativeai as genai
+
+    if not settings.GOOGLE_GEMINI_API_KEY:
+        raise RuntimeError("GOOGLE_GEMINI_API_KEY is not configured")
+    genai.configure(api_key=settings.GOOGLE_GEMINI_API_KEY)
+    return genai
 
 
 class GeminiService:
     def __init__(self):
-        self.model = genai.GenerativeModel("gemini-pro")
+        self._model = None
         self.generation_config = {
             "temperature": 0.3,
             "top_p": 0.9,
             "max_output_tokens": 2048,
             "candidate_count": 1,
         }
-        self.redis_manager = RedisManager()
+
+    @property
+    def model(self):
+        if self._model is None:
+            self._model = get_genai().GenerativeModel("gemini-pro")
+        return self._model
 
     def _generate_prompt(self, games: GameList) -> str:
         prompt = """You are a specialized MLB game summarizer. Your task is to create concise game summaries in a strict JSON format.
@@ -80,29 +92,11 @@ Format:
 
         return {}
 
-    async def set_game_summary(self, games: GameList) -> GameList:
-        """Process all games in parallel batches and set their summaries with caching."""
-        BATCH_SIZE = 5  # Increased batch size for better throughput
-
-        # Check cache for each game first
-        uncached_games = []
-        for game in games.games:
-            game_id = str(game.id)
-            cached_summary = await self.redis_manager.get_games(
-                game.date.year, game.teams["home"].id
-            )
-            if cached_summary and game_id in cached_summary.games:
-                game.summary = cached_summary.games[game_id].summary
-            else:
-                uncached_games.append(game)
-
-        if not uncached_games:
-            return games
-
-        # Process uncached games in parallel batches
+    async def summarize_games(self, games: List[Game]) -> Dict[int, Dict[str, str]]:
+        """Summarize games in parallel batches; games Gemini failed on are omitted."""
+        batch_size = settings.SUMMARY_BATCH_SIZE
         game_batches = [
-            uncached_games[i : i + BATCH_SIZE]
-            for i in range(0, len(uncached_games), BATCH_SIZE)
+            games[i : i + batch_size] for i in range(0, len(games), batch_size)
         ]
 
         # Process batches concurrently with semaphore to control API rate
@@ -116,16 +110,16 @@ Format:
             *[process_batch_with_semaphore(batch) for batch in game_batches]
         )
 
-        # Combine results and update game summaries
+        # Combine results
         all_summaries = {}
         for batch_summary in batch_results:
             all_summaries.update(batch_summary)
 
-        # Update game summaries and cache results
-        for game in uncached_games:
+        summaries = {}
+        for game in games:
             game_id = str(game.id)
             if game_id in all_summaries:
-                game.summary = {
+                summaries[game.id] = {
                     "en": all_summaries[game_id].get(
                         "en", "No English summary available."
                     ),
@@ -136,19 +130,10 @@ Format:
                         "ja", "No Japanese summary available."
                     ),
                 }
-                # Cache the game summary
-                await self.redis_manager.set_games(
-                    GameList(total_items=1, games=[game]),
-                    game.date.year,
-                    game.teams["home"].id,
-                )
-            else:
-                self._set_default_summary(game)
-
-        return games
+        return summaries
 
-    def _set_default_summary(self, game):
-        game.summary = {
+    def default_summary(self, game: Game) -> Dict[str, str]:
+        return {
             "en": f"{game.teams['away'].name} vs {game.teams['home'].name} - Final score: {game.score.away}-{game.score.home}",
             "es": f"{game.teams['away'].name} vs {game.teams['home'].name} - Resultado final: {game.score.away}-{game.score.home}",
             "ja": f"{game.teams['away'].name} vs {game.teams['home'].name} - 最終スコア: {game.score.away}-{game.score.home}",
@@ -0,0 +1,151 @@
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+import copy
+from app.services.feed_processor import play_to_event
+
+if TYPE_CHECKING:
+    from app.services.mlb_api import MLBAPIClient
+
+
+def _feed_timecode(feed: dict) -> Optional[str]:
+    return feed.get("metaData", {}).get("timeStamp")
+
+
+def _split_pointer(pointer: str) -> List[str]:
+    """Split an RFC 6901 JSON pointer into unescaped tokens."""
+    if not pointer:
+        return []
+    return [
+        token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")
+    ]
+
+
+def _resolve_parent(doc: Any, pointer: str) -> Tuple[Any, str]:
+    tokens = _split_pointer(pointer)
+    if not tokens:
+        raise ValueError("Patch operations on the document root are not supported")
+    parent = doc
+    for token in tokens[:-1]:
+        parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+    return parent, tokens[-1]
+
+
+def _get(doc: Any, pointer: str) -> Any:
+    value = doc
+    for token in _split_pointer(pointer):
+        value = value[int(token)] if isinstance(value, list) else value[token]
+    return value
+
+
+def _add(doc: Any, pointer: str, value: Any):
+    parent, key = _resolve_parent(doc, pointer)
+    if isinstance(parent, list):
+        if key == "-":
+            parent.append(value)
+        else:
+            parent.insert(int(key), value)
+    else:
+        parent[key] = value
+
+
+def _remove(doc: Any, pointer: str) -> Any:
+    parent, key = _resolve_parent(doc, pointer)
+    if isinstance(parent, list):
+        return parent.pop(int(key))
+    return parent.pop(key)
+
+
+def _replace(doc: Any, pointer: str, value: Any):
+    parent, key = _resolve_parent(doc, pointer)
+    if isinstance(parent, list):
+        parent[int(key)] = value
+    else:
+        parent[key] = value
+
+
+def apply_json_patch(doc: dict, operations: List[dict]):
+    """Apply RFC 6902 operations to ``doc`` in place."""
+    for operation in operations:
+        op = operation["op"]
+        path = operation["path"]
+        if op == "add":
+            _add(doc, path, operation["value"])
+        elif op == "remove":
+            _remove(doc, path)
+        elif op == "replace":
+            _replace(doc, path, operation["value"])
+        elif op == "move":
+            _add(doc, path, _remove(doc, operation["from"]))
+        elif op == "copy":
+            _add(doc, path, copy.deepcopy(_get(doc, operation["from"])))
+        elif op == "test":
+            if _get(doc, path) != operation["value"]:
+                raise ValueError(f"Patch test failed at {path}")
+        else:
+            raise ValueError(f"Unsupported patch operation: {op}")
+
+
+class LiveGameState:
+    """Feed and derived data held between refreshes of one in-progress game."""
+
+    def __init__(self, feed: dict):
+        self.reset(feed)
+
+    def reset(self, feed: dict):
+        self.feed = feed
+        self.timecode = _feed_timecode(feed)
+        self.events: List[dict] = []
+        self.processed_plays = 0
+
+
+class LiveGameTracker:
+    """Keeps in-progress GUMBO feeds up to date by applying diffPatch deltas."""
+
+    def __init__(self, client: "MLBAPIClient"):
+        self.client = client
+        self._states: Dict[int, LiveGameState] = {}
+
+    def forget(self, game_id: int):
+        self._states.pop(game_id, None)
+
+    async def refresh(self, game_id: int) -> Optional[LiveGameState]:
+        """Bring a game's feed up to date and consume any newly completed plays."""
+        state = self._states.get(game_id)
+
+        if state is None or not state.timecode:
+            feed = await self.client.get_game_details(game_id)
+            if not feed:
+                return state
+            state = LiveGameState(feed)
+            self._states[game_id] = state
+        else:
+            patches = await self.client.get_game_diff_patch(game_id, state.timecode)
+            if isinstance(patches, dict):
+                # GUMBO sends the full feed when the delta would be too large
+                state.reset(patches)
+            elif patches:
+                try:
+                    for patch in patches:
+                        apply_json_patch(state.feed, patch.get("diff", []))
+                    state.timecode = _feed_timecode(state.feed)
+                except (KeyError, IndexError, ValueError, TypeError) as e:
+                    print(f"Error applying diffPatch for game {game_id}: {str(e)}")
+                    feed = await self.client.get_game_details(game_id)
+                    if not feed:
+                        self.forget(game_id)
+                        return None
+                    state.reset(feed)
+
+        self._consume_new_plays(state)
+        return state
+
+    def _consume_new_plays(self, state: LiveGameState):
+        """Turn plays completed since the last refresh into events."""
+        all_plays = state.feed.get("liveData", {}).get("plays", {}).get("allPlays", [])
+        while state.processed_plays < len(all_plays):
+            play = all_plays[state.processed_plays]
+            if not play.get("about", {}).get("isComplete", False):
+                break
+            event = play_to_event(play)
+            if event:
+                state.events.append(event)
+            state.processed_plays += 1
@@ -1,20 +1,34 @@
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional, Tuple, Union
 import aiohttp
 import asyncio
-from app.config import settings
+from app.config import settings, GameDetailLevel
 from app.models.game import Game, GameStatus, Team, GameScore, GameList
-from app.services.gemini_service import GeminiService
+from app.services.live_game_tracker import LiveGameTracker
+from app.services.feed_processor import (
+    decode_game_enrichment,
+    decode_game_stats,
+    extract_player_lines,
+    get_decisions,
+    get_top_performer,
+    run_in_feed_pool,
+)
 from app.cache.redis_manager import RedisManager
+from app.queue.summary_queue import SummaryJobQueue, InMemorySummaryQueue
 
 
 class MLBAPIClient:
-    def __init__(self):
+    def __init__(self, summary_queue: Optional[SummaryJobQueue] = None):
         self.base_url = settings.MLB_API_BASE_URL
         self.gumbo_url = settings.MLB_GUMBO_API_BASE_URL
-        self.gemini_service = GeminiService()
+        self.summary_queue = summary_queue or InMemorySummaryQueue()
+        self.live_tracker = LiveGameTracker(self)
+        self._season_loads: Dict[tuple, asyncio.Task] = {}
+        self._season_schedules: Dict[tuple, List[dict]] = {}
+        self._game_tasks: Dict[int, asyncio.Task] = {}
+        # Shared by every request so bulk loads cannot flood statsapi
+        self._gumbo_semaphore = asyncio.Semaphore(settings.MLB_API_CONCURRENCY)
         self.session = None
-        self.batch_size = 10
 
     async def _get_session(self):
         if self.session is None:
@@ -26,16 +40,181 @@ class MLBAPIClient:
             await self.session.close()
             self.session = None
 
-    async def get_games(
-        self, season: int, team_id: int, page: int = 1, per_page: int = 10
-    ) -> GameList:
-        """Fetch all games for a given season and team ID with pagination."""
+    async def get_season_games(
+        self,
+        season: int,
+        team_id: int,
+        level: GameDetailLevel,
+        deadline: Optional[float] = None,
+    ) -> Tuple[GameList, Optional[str]]:
+        """Fetch a whole season at ``level`` together with its cache ETag.
+
+        Schedule and enriched tiers are cached independently, so list views
+        never trigger GUMBO fetches. Summaries are stored per game and are
+        attached on top of the enriched tier.
+
+        ``deadline`` is an event loop time. If the season is still loading when
+        it passes, whatever is finished is returned with the rest flagged as
+        partial (and no ETag). Loading carries on in the background and fills
+        the cache for the next caller.
+        """
+        results = await self.get_many_season_games([(season, team_id)], level, deadline)
+        return results[0]
+
+    async def get_many_season_games(
+        self,
+        combos: List[Tuple[int, int]],
+        level: GameDetailLevel,
+        deadline: Optional[float] = None,
+    ) -> List[Tuple[GameList, Optional[str]]]:
+        """Fetch several ``(season, team_id)`` seasons, in order, like get_season_games.
+
+        Every combination is read from cache in one pipelined round trip. Misses
+        load concurrently; a game shared by two teams is fetched once, and all
+        GUMBO fetches share the client's concurrency budget.
+        """
+        tier = (
+            GameDetailLevel.SCHEDULE
+            if level == GameDetailLevel.SCHEDULE
+            else GameDetailLevel.ENRICHED
+        )
+        keys = [(season, team_id, tier) for season, team_id in combos]
+
         # Check cache first
-        redis_manager = RedisManager()
-        cached_games = await redis_manager.get_games(season, team_id)
-        if cached_games:
-            return cached_games
+        cached = await RedisManager().get_games_many(keys)
+
+        loads = {}
+        for key, (cached_games, _) in zip(keys, cached):
+            if cached_games is None and key not in loads:
+                loads[key] = self._start_season_load(key)
+
+        if loads:
+            timeout = None
+            if deadline is not None:
+                timeout = max(deadline - asyncio.get_running_loop().time(), 0)
+            await asyncio.wait(set(loads.values()), timeout=timeout)
+
+        results = []
+        for key, (cached_games, etag) in zip(keys, cached):
+            if cached_games is not None:
+                results.append((cached_games, etag))
+            elif loads[key].done():
+                results.append(loads[key].result())
+            else:
+                results.append((self._partial_season(key), None))
+        return results
+
+    def _start_season_load(self, key: tuple) -> asyncio.Task:
+        """Callers asking for the same season share one in-flight load."""
+        load = self._season_loads.get(key)
+        if load is None:
+            load = asyncio.create_task(self._load_season(*key))
+            self._season_loads[key] = load
+            load.add_done_callback(lambda task: self._finish_season_load(key, task))
+        return load
+
+    async def _load_season(
+        self, season: int, team_id: int, tier: GameDetailLevel
+    ) -> Tuple[GameList, Optional[str]]:
+        """Fetch, enrich and cache a whole season."""
+        key = (season, team_id, tier)
+        schedule = await self._fetch_schedule(season, team_id)
+        self._season_schedules[key] = schedule
+
+        if tier == GameDetailLevel.SCHEDULE:
+            results = [self._build_game(game_data) for game_data in schedule]
+        else:
+
+            async def process_game_with_semaphore(game_data):
+                async with self._gumbo_semaphore:
+                    return await self._process_game(game_data)
+
+            # Tasks rather than bare coroutines so partial responses can peek,
+            # and so a game already loading for the other team is reused
+            for game_data in schedule:
+                if game_data["gamePk"] not in self._game_tasks:
+                    self._game_tasks[game_data["gamePk"]] = asyncio.create_task(
+                        process_game_with_semaphore(game_data)
+                    )
+
+            # Process all games concurrently
+            results = await asyncio.gather(
+                *[self._game_tasks[game_data["gamePk"]] for game_data in schedule]
+            )
+            # Keep games whose GUMBO fetch failed, flagged so they are not
+            # served as final and are retried once the cache entry expires
+            results = [
+                game or self._partial_game(game_data)
+                for game, game_data in zip(results, schedule)
+            ]
+
+        all_games = [game for game in results if game]
+
+        # Sort games by date in descending order
+        all_games.sort(key=lambda x: x.date, reverse=True)
+
+        games = GameList(
+            total_items=len(all_games),
+            games=all_games,
+            partial=any(game.partial for game in all_games),
+        )
+        etag = await RedisManager().set_games(games, season, team_id, tier)
+        return games, etag
+
+    def _finish_season_load(self, key: tuple, task: asyncio.Task):
+        self._season_loads.pop(key, None)
+        schedule = self._season_schedules.pop(key, [])
+
+        # Drop game tasks no other in-flight load is still waiting on
+        still_loading = {
+            game_data["gamePk"]
+            for other_schedule in self._season_schedules.values()
+            for game_data in other_schedule
+        }
+        for game_data in schedule:
+            if game_data["gamePk"] not in still_loading:
+                self._game_tasks.pop(game_data["gamePk"], None)
+
+        if not task.cancelled() and task.exception():
+            print(f"Error loading season {key}: {task.exception()}")
+
+    def _partial_season(self, key: tuple) -> GameList:
+        """Snapshot an in-flight season load: finished games plus schedule-only rest."""
+        all_games = []
+        for game_data in self._season_schedules.get(key, []):
+            task = self._game_tasks.get(game_data["gamePk"])
+            if task and task.done() and not task.cancelled() and task.result():
+                all_games.append(task.result())
+            elif key[2] == GameDetailLevel.ENRICHED:
+                game = self._partial_game(game_data)
+                if game:
+                    all_games.append(game)
+
+        # Sort games by date in descending order
+        all_games.sort(key=lambda x: x.date, reverse=True)
+
+        return GameList(total_items=len(all_games), games=all_games, partial=True)
 
+    def _partial_game(self, game_data: dict) -> Optional[Game]:
+        """Schedule-only stand-in for a game whose enrichment is missing."""
+        game = self._build_game(game_data)
+        if game:
+            game.partial = True
+        return game
+
+    @staticmethod
+    def paginate(games: GameList, page: int, per_page: int) -> GameList:
+        """Slice one page out of a season, copying games so callers can mutate them."""
+        start_idx = (page - 1) * per_page
+        end_idx = start_idx + per_page
+        return GameList(
+            total_items=games.total_items,
+            games=[game.model_copy() for game in games.games[start_idx:end_idx]],
+            partial=games.partial,
+        )
+
+    async def _fetch_schedule(self, season: int, team_id: int) -> List[dict]:
+        """Fetch the raw schedule entries of a team's season."""
         url = f"{self.base_url}/schedule"
         params = {
             "sportId": settings.MLB_SPORT_ID,
@@ -51,189 +230,138 @@ class MLBAPIClient:
             response.raise_for_status()
             data = await response.json()
 
-        # Process games in parallel with improved batching
-        all_games = []
-        game_tasks = []
-        semaphore = asyncio.Semaphore(5)  # Limit concurrent API calls
-
-        async def process_game_with_semaphore(game_data):
-            async with semaphore:
-                return await self._process_game(game_data)
+        return [
+            game_data
+            for date in data.get("dates", [])
+            for game_data in date.get("games", [])
+        ]
 
-        for date in data.get("dates", []):
-            for game_data in date.get("games", []):
-                game_tasks.append(process_game_with_semaphore(game_data))
+    async def attach_summaries(self, games: List[Game]):
+        """Fill in stored summaries and queue the rest for generation."""
+        redis_manager = RedisManager()
+        missing = []
+        for game in games:
+            # Partial games lack the GUMBO data a summary is written from
+            if game.partial:
+                game.summary_pending = True
+                continue
+            if not game.summary:
+                missing.append(game)
+        records = await redis_manager.get_summaries([game.id for game in missing])
+
+        pending = []
+        for game in missing:
+            record = records.get(game.id)
+            # Reused until the score or a pitching decision changes, live or final
+            if record and record.get("fingerprint") == game.summary_fingerprint():
+                game.summary = record["summary"]
+                game.summary_pending = False
+                game.summary_fallback = record.get("fallback", False)
+            else:
+                game.summary_pending = True
+                pending.append(game)
+
+        if pending:
+            await self.summary_queue.enqueue(pending)
 
-        # Process all games concurrently
-        batch_results = await asyncio.gather(*game_tasks)
-        all_games.extend([game for game in batch_results if game])
+    async def get_game_details(self, game_id: int) -> Optional[dict]:
+        """Fetch detailed game data from MLB GUMBO API."""
+        url = f"{self.gumbo_url}/game/{game_id}/feed/live"
 
-        # Sort games by date in descending order
-        all_games.sort(key=lambda x: x.date, reverse=True)
+        try:
+            session = await self._get_session()
+            async with session.get(url, timeout=30) as response:
+                response.raise_for_status()
+                return await response.json()
+        except (aiohttp.ClientError, ValueError, asyncio.TimeoutError):
+            return None
 
-        # Initialize empty list if no games found
-        if not all_games:
-            return GameList(total_items=0, games=[])
+    async def get_game_diff_patch(
+        self, game_id: int, start_timecode: str
+    ) -> Optional[Union[list, dict]]:
+        """Fetch GUMBO changes since ``start_timecode``.
 
-        # Calculate pagination
-        total_items = len(all_games)
-        start_idx = (page - 1) * per_page
-        end_idx = start_idx + per_page
-        paginated_games_no_summary = all_games[start_idx:end_idx]
-        paginated_games_with_summary = await self.gemini_service.set_game_summary(
-            GameList(total_items=total_items, games=paginated_games_no_summary)
-        )
+        Returns a list of JSON patches, or the full feed when GUMBO decides the
+        delta is too large to send as patches.
+        """
+        url = f"{self.gumbo_url}/game/{game_id}/feed/live/diffPatch"
+        params = {"startTimecode": start_timecode}
 
-        return GameList(
-            total_items=total_items, games=paginated_games_with_summary.games
-        )
+        try:
+            session = await self._get_session()
+            async with session.get(url, params=params, timeout=30) as response:
+                response.raise_for_status()
+                return await response.json()
+        except (aiohttp.ClientError, ValueError, asyncio.TimeoutError):
+            return None
 
-    async def get_game_details(self, game_id: int) -> Optional[dict]:
-        """Fetch detailed game data from MLB GUMBO API."""
+    async def get_game_details_raw(self, game_id: int) -> Optional[bytes]:
+        """Fetch the undecoded GUMBO feed so it can be parsed off the event loop."""
         url = f"{self.gumbo_url}/game/{game_id}/feed/live"
 
         try:
             session = await self._get_session()
             async with session.get(url, timeout=30) as response:
                 response.raise_for_status()
-                return await response.json()
-        except (aiohttp.ClientError, ValueError, asyncio.TimeoutError):
+                return await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
             return None
 
     async def get_game_stats(self, game_id: int) -> Optional[dict]:
         """Process and extract relevant game statistics for recap generation."""
-        game_data = await self.get_game_details(game_id)
-        if not game_data:
+        raw_feed = await self.get_game_details_raw(game_id)
+        if not raw_feed:
             return None
 
         try:
-            live_data = game_data.get("liveData", {})
-            linescore = live_data.get("linescore", {})
-            boxscore = live_data.get("boxscore", {})
-            plays = live_data.get("plays", {})
-            decisions = live_data.get("decisions", {})
-
-            # Extract team stats (batting and pitching)
-            team_stats = {}
-            for team_id, team_data in boxscore.get("teams", {}).items():
-                team_batting = team_data.get("teamStats", {}).get("batting", {})
-                team_pitching = team_data.get("teamStats", {}).get("pitching", {})
-
-                team_stats[team_id] = {
-                    "batting": {
-                        "hits": team_batting.get("hits", 0),
-                        "runs": team_batting.get("runs", 0),
-                        "strikeouts": team_batting.get("strikeOuts", 0),
-                        "walks": team_batting.get("baseOnBalls", 0),
-                        "avg": team_batting.get("avg", ".000"),
-                        "batting_highlights": [],
-                    },
-                    "pitching": {
-                        "strikeouts": team_pitching.get("strikeOuts", 0),
-                        "walks": team_pitching.get("baseOnBalls", 0),
-                        "earned_runs": team_pitching.get("earnedRuns", 0),
-                        "era": team_pitching.get("era", "0.00"),
-                        "pitching_highlights": [],
-                    },
-                }
-
-                # Process individual player stats
-                for player_id, player in team_data.get("players", {}).items():
-                    # Batting highlights
-                    batting_stats = player.get("stats", {}).get("batting", {})
-                    if batting_stats.get("hits", 0) > 0:
-                        team_stats[team_id]["batting"]["batting_highlights"].append(
-                            {
-                                "player_name": player.get("person", {}).get(
-                                    "fullName", ""
-                                ),
-                                "hits": batting_stats.get("hits", 0),
-                                "home_runs": batting_stats.get("homeRuns", 0),
-                                "rbi": batting_stats.get("rbi", 0),
-                                "avg": batting_stats.get("avg", ".000"),
-                            }
-                        )
-
-                    # Pitching highlights
-                    pitching_stats = player.get("stats", {}).get("pitching", {})
-                    if pitching_stats.get("inningsPitched", 0) > 0:
-                        team_stats[team_id]["pitching"]["pitching_highlights"].append(
-                            {
-                                "player_name": player.get("person", {}).get(
-                                    "fullName", ""
-                                ),
-                                "innings_pitched": pitching_stats.get(
-                                    "inningsPitched", "0.0"
-                                ),
-                                "strikeouts": pitching_stats.get("strikeOuts", 0),
-                                "walks": pitching_stats.get("baseOnBalls", 0),
-                                "earned_runs": pitching_stats.get("earnedRuns", 0),
-                                "era": pitching_stats.get("era", "0.00"),
-                            }
-                        )
-
-            # Get key moments and plays
-            key_plays = []
-            for play in plays.get("allPlays", []):
-                if play.get("about", {}).get("isComplete", False) and (
-                    play.get("result", {}).get("rbi", 0) > 0
-                    or play.get("result", {}).get("event")
-                    in ["Home Run", "Strikeout", "Walk"]
-                ):
-                    key_plays.append(
-                        {
-                            "inning": play.get("about", {}).get("inning"),
-                            "half_inning": play.get("about", {}).get("halfInning"),
-                            "description": play.get("result", {}).get(
-                                "description", ""
-                            ),
-                            "rbi": play.get("result", {}).get("rbi", 0),
-                            "event": play.get("result", {}).get("event"),
-                            "batter": play.get("matchup", {})
-                            .get("batter", {})
-                            .get("fullName"),
-                            "pitcher": play.get("matchup", {})
-                            .get("pitcher", {})
-                            .get("fullName"),
-                        }
-                    )
-
-            return {
-                "linescore": linescore,
-                "team_stats": team_stats,
-                "scoring_plays": plays.get("scoringPlays", []),
-                "key_plays": key_plays,
-                "home_runs": plays.get("homeRuns", []),
-                "decisions": {
-                    "winner": decisions.get("winner", {}).get("fullName"),
-                    "loser": decisions.get("loser", {}).get("fullName"),
-                    "save": decisions.get("save", {}).get("fullName"),
-                },
-                "game_info": {
-                    "venue": game_data.get("gameData", {}).get("venue", {}).get("name"),
-                    "weather": game_data.get("gameData", {}).get("weather", {}),
-                    "attendance": game_data.get("gameData", {}).get("attendance"),
-                    "game_time": game_data.get("gameData", {})
-                    .get("gameInfo", {})
-                    .get("gameDurationMinutes"),
-                },
-            }
-        except (KeyError, AttributeError):
+            return await run_in_feed_pool(decode_game_stats, raw_feed)
+        except ValueError:
             return None
 
     async def _process_game(self, game_data: dict) -> Optional[Game]:
         """Process raw game data into Game model."""
         try:
-            # Get detailed game data from GUMBO API with timeout handling
-            game_details = await self.get_game_details(game_data["gamePk"])
-            if not game_details:
-                return None
+            # In-progress games are refreshed from deltas instead of the full feed
+            live_state = None
+            if game_data["status"]["abstractGameState"] == "Live":
+                live_state = await self.live_tracker.refresh(game_data["gamePk"])
+                if not live_state:
+                    return None
+                live_data = live_state.feed.get("liveData", {})
+                enrichment = {
+                    **get_decisions(live_data),
+                    "top_performer": get_top_performer(live_data.get("boxscore", {})),
+                    "events": list(live_state.events),
+                    "players": extract_player_lines(live_state.feed),
+                }
+            else:
+                self.live_tracker.forget(game_data["gamePk"])
+                # Get detailed game data from GUMBO API with timeout handling
+                raw_feed = await self.get_game_details_raw(game_data["gamePk"])
+                if not raw_feed:
+                    return None
+                # Decode and extract in the process pool, off the event loop
+                enrichment = await run_in_feed_pool(decode_game_enrichment, raw_feed)
+
+            # Keep the player index in step with every processed feed
+            await RedisManager().index_player_lines(
+                game_data["gamePk"],
+                int(game_data.get("season") or game_data["gameDate"][:4]),
+                datetime.strptime(game_data["gameDate"], "%Y-%m-%dT%H:%M:%SZ"),
+                enrichment["players"],
+            )
+        except Exception as e:
+            print(f"Unexpected error in _process_game: {str(e)}")
+            return None
 
-            live_data = game_details.get("liveData", {})
-            boxscore = live_data.get("boxscore", {})
-            plays = live_data.get("plays", {})
-            decisions = live_data.get("decisions", {})
+        return self._build_game(game_data, enrichment)
 
+    def _build_game(
+        self, game_data: dict, enrichment: Optional[dict] = None
+    ) -> Optional[Game]:
+        """Build a Game from schedule data, plus GUMBO enrichment when given."""
+        enrichment = enrichment or {}
+        try:
             # Process game data concurrently
             linescore = game_data.get("linescore", {})
             teams_data = linescore.get("teams", {})
@@ -246,15 +374,6 @@ class MLBAPIClient:
             away_errors = away_team.get("errors")
             home_errors = home_team.get("errors")
 
-            # Get decisions data
-            winning_pitcher = decisions.get("winner", {}).get("fullName")
-
-            # Optimize top performer calculation
-            top_performer = await self._get_top_performer(boxscore)
-
-            # Process game events efficiently
-            events = await self._process_game_events(plays)
-
             return Game(
                 id=game_data["gamePk"],
                 game_type=game_data["gameType"],
@@ -286,60 +405,15 @@ class MLBAPIClient:
                 home_hits=home_hits,
                 away_errors=away_errors,
                 home_errors=home_errors,
-                winning_pitcher=winning_pitcher,
-                top_performer=top_performer,
-                events=events,
+                winning_pitcher=enrichment.get("winning_pitcher"),
+                losing_pitcher=enrichment.get("losing_pitcher"),
+                save_pitcher=enrichment.get("save_pitcher"),
+                top_performer=enrichment.get("top_performer"),
+                events=enrichment.get("events"),
             )
         except KeyError as e:
-            print(f"KeyError in _process_game: {str(e)}")
+            print(f"KeyError in _build_game: {str(e)}")
             return None
         except Exception as e:
-            print(f"Unexpected error in _process_game: {str(e)}")
-            return None
-
-    async def _get_top_performer(self, boxscore: dict) -> Optional[str]:
-        """Get top performer based on game stats."""
-        try:
-            top_performer = None
-            max_hits = 0
-            max_rbi = 0
-
-            for team_data in boxscore.get("teams", {}).values():
-                for player in team_data.get("players", {}).values():
-                    batting_stats = player.get("stats", {}).get("batting", {})
-                    hits = batting_stats.get("hits", 0)
-                    rbi = batting_stats.get("rbi", 0)
-
-                    if hits > max_hits or (hits == max_hits and rbi > max_rbi):
-                        max_hits = hits
-                        max_rbi = rbi
-                        top_performer = player.get("person", {}).get("fullName")
-
-            return top_performer
-        except Exception as e:
-            print(f"Error getting top performer: {str(e)}")
+            print(f"Unexpected error in _build_game: {str(e)}")
             return None
-
-    async def _process_game_events(self, plays: dict) -> list:
-        """Process game events efficiently."""
-        try:
-            events = []
-            for play in plays.get("allPlays", []):
-                if play.get("about", {}).get("isComplete", False) and (
-                    play.get("result", {}).get("rbi", 0) > 0
-                    or play.get("result", {}).get("event")
-                    in ["Home Run", "Triple", "Double"]
-                ):
-                    events.append(
-                        {
-                            "inning": str(play.get("about", {}).get("inning")),
-                            "title": play.get("result", {}).get("event"),
-                            "description": play.get("result", {}).get(
-                                "description", ""
-                            ),
-                        }
-                    )
-            return events
-        except Exception as e:
-            print(f"Error processing game events: {str(e)}")
-            return []
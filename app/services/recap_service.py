@@ -1,6 +1,6 @@
 from typing import Optional
-import google.generativeai as genai
 from app.models.game import Game
+from app.services.gemini_service import get_genai
 import asyncio
 import time
 from collections import deque
@@ -8,7 +8,8 @@ from collections import deque
 
 class RecapService:
     def __init__(self):
-        self.model = genai.GenerativeModel("gemini-pro")
+        self._model = None
+        self._translate_client = None
         self.generation_config = {
             "temperature": 0.3,
             "top_p": 0.9,
@@ -19,6 +20,12 @@ class RecapService:
         self._rate_limit = 60
         self._time_window = 60
 
+    @property
+    def model(self):
+        if self._model is None:
+            self._model = get_genai().GenerativeModel("gemini-pro")
+        return self._model
+
     def _check_rate_limit(self) -> bool:
         current_time = time.time()
         # Clean up old timestamps
@@ -128,10 +135,11 @@ Provide a concise 2-3 sentence recap focusing on the final score and key perform
 
     async def _translate_recap(self, recap: str, target_language: str) -> Optional[str]:
         try:
-            from google.cloud import translate_v2 as translate
+            if self._translate_client is None:
+                from google.cloud import translate_v2 as translate
 
-            translate_client = translate.Client()
-            translation = translate_client.translate(
+                self._translate_client = translate.Client()
+            translation = self._translate_client.translate(
                 recap, target_language=target_language, source_language="en"
             )
 
@@ -0,0 +1,78 @@
+from typing import List, Optional
+import asyncio
+from app.config import settings
+from app.cache.redis_manager import RedisManager
+from app.queue.summary_queue import SummaryJob, SummaryJobQueue
+from app.services.gemini_service import GeminiService
+
+
+class SummaryWorker:
+    """Background consumer that batches queued games across requests for Gemini."""
+
+    def __init__(
+        self,
+        queue: SummaryJobQueue,
+        gemini_service: Optional[GeminiService] = None,
+        redis_manager: Optional[RedisManager] = None,
+    ):
+        self.queue = queue
+        self.gemini_service = gemini_service or GeminiService()
+        self.redis_manager = redis_manager or RedisManager()
+        self._task: Optional[asyncio.Task] = None
+        self._in_flight = set()
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def run(self):
+        semaphore = asyncio.Semaphore(settings.SUMMARY_WORKER_CONCURRENCY)
+        while True:
+            await semaphore.acquire()
+            try:
+                jobs = await self.queue.dequeue_batch(
+                    settings.SUMMARY_BATCH_SIZE,
+                    linger_ms=settings.SUMMARY_BATCH_LINGER_MS,
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error reading summary jobs: {e}")
+                semaphore.release()
+                await asyncio.sleep(1)
+                continue
+
+            if not jobs:
+                semaphore.release()
+                continue
+
+            task = asyncio.create_task(self._process_jobs(jobs))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+            task.add_done_callback(lambda _: semaphore.release())
+
+    async def _process_jobs(self, jobs: List[SummaryJob]):
+        """Summarize one batch, store the results and acknowledge the jobs."""
+        games = [game for _, game in jobs]
+        try:
+            summaries = await self.gemini_service.summarize_games(games)
+            await self.redis_manager.set_summaries(games, summaries)
+
+            # Keep fallbacks only briefly so Gemini is retried on a later request
+            failed = [game for game in games if game.id not in summaries]
+            await self.redis_manager.set_summaries(
+                failed,
+                {game.id: self.gemini_service.default_summary(game) for game in failed},
+                ttl=settings.CACHE_TTL,
+                fallback=True,
+            )
+            await self.queue.ack(jobs)
+        except Exception as e:
+            print(f"Error processing summary jobs: {e}")
+            await self.queue.release(jobs)
@@ -0,0 +1,262 @@
+"""Cold /games requests through Gunicorn workers and their feed parsing pools.
+
+Serves synthetic schedules and GUMBO feeds from a local stub upstream, then
+for each WEB_CONCURRENCY and FEED_PROCESS_POOL_SIZE pair starts Gunicorn with
+gunicorn.conf.py and sends concurrent /games requests for teams that are not
+cached, so every request fetches and parses its season's feeds. Uses the
+Redis from settings; the keys the runs write are deleted afterwards.
+
+Usage: python -m benchmarks.cold_games [--workers 1,2,4] [--pool-sizes 0,1,2]
+    [--requests 16] [--concurrency 8] [--games 20]
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+import aiohttp
+
+from app.cache.redis_manager import RedisManager
+from app.config import settings
+from app.services.feed_processor import extract_player_lines
+from benchmarks.feed_decode import build_feed
+from benchmarks.startup import _free_port
+
+SEASON = 2010
+FIRST_TEAM_ID = 990001  # Not real teams, so seeded keys never collide with real data
+FIRST_GAME_ID = 990000000
+FIRST_PLAYER_ID = 990000000
+
+
+def schedule_entry(game_id: int, team_id: int, day: int) -> dict:
+    return {
+        "gamePk": game_id,
+        "gameType": "R",
+        "season": str(SEASON),
+        "gameDate": f"{SEASON}-05-{day % 28 + 1:02d}T23:05:00Z",
+        "status": {
+            "abstractGameState": "Final",
+            "detailedState": "Final",
+            "statusCode": "F",
+        },
+        "teams": {
+            "away": {
+                "team": {
+                    "id": team_id,
+                    "name": "Benchmark Visitors",
+                    "abbreviation": "BV",
+                },
+                "score": day % 9,
+            },
+            "home": {
+                "team": {"id": 1, "name": "Benchmark Hosts", "abbreviation": "BH"},
+                "score": (day + 4) % 9,
+            },
+        },
+        "venue": {"name": "Benchmark Park"},
+        "linescore": {
+            "teams": {
+                "away": {"hits": 8, "errors": 0},
+                "home": {"hits": 6, "errors": 1},
+            }
+        },
+    }
+
+
+def start_upstream(games: int, feed: bytes) -> ThreadingHTTPServer:
+    """Serve /schedule and /game/{id}/feed/live like statsapi, from memory."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path.endswith("/schedule"):
+                team_id = int(parse_qs(url.query)["teamId"][0])
+                first = FIRST_GAME_ID + (team_id - FIRST_TEAM_ID) * games
+                body = json.dumps(
+                    {
+                        "dates": [
+                            {
+                                "games": [
+                                    schedule_entry(first + i, team_id, i)
+                                    for i in range(games)
+                                ]
+                            }
+                        ]
+                    }
+                ).encode()
+            elif url.path.endswith("/feed/live"):
+                body = feed
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def start_gunicorn(port: int, upstream: str, workers: int, pool_size: int):
+    env = {
+        **os.environ,
+        "PORT": str(port),
+        "WEB_CONCURRENCY": str(workers),
+        "FEED_PROCESS_POOL_SIZE": str(pool_size),
+        "MLB_API_BASE_URL": upstream,
+        "MLB_GUMBO_API_BASE_URL": upstream,
+    }
+    return subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "main:app"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def wait_healthy(session: aiohttp.ClientSession, base: str, timeout=30.0):
+    started = time.perf_counter()
+    while time.perf_counter() - started < timeout:
+        try:
+            async with session.get(f"{base}/health") as response:
+                if response.status == 200:
+                    return
+        except aiohttp.ClientError:
+            pass
+        await asyncio.sleep(0.05)
+    raise TimeoutError(f"Gunicorn did not answer within {timeout}s")
+
+
+async def cold_requests(
+    session: aiohttp.ClientSession, base: str, teams: list, concurrency: int
+) -> list:
+    """Request each uncached team once; returns per-request latencies in ms."""
+    semaphore = asyncio.Semaphore(concurrency)
+    path = f"{base}/api/{settings.API_VERSION}/games"
+
+    async def request(team_id: int) -> float:
+        params = {
+            "season": SEASON,
+            "team_id": team_id,
+            "include": "enriched",
+            "timeout_ms": 0,
+            "per_page": 100,
+        }
+        async with semaphore:
+            started = time.perf_counter()
+            async with session.get(path, params=params) as response:
+                await response.read()
+                assert response.status == 200, response.status
+            return (time.perf_counter() - started) * 1000
+
+    return await asyncio.gather(*[request(team_id) for team_id in teams])
+
+
+async def measure(args, upstream: str, workers: int, pool_size: int, teams) -> tuple:
+    port = _free_port()
+    base = f"http://127.0.0.1:{port}"
+    server = start_gunicorn(port, upstream, workers, pool_size)
+    timeout = aiohttp.ClientTimeout(total=300)
+    try:
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            await wait_healthy(session, base)
+            # Start each worker's feed pool so process start-up is not measured
+            await cold_requests(
+                session, base, [next(teams) for _ in range(workers)], workers
+            )
+            started = time.perf_counter()
+            latencies = await cold_requests(
+                session,
+                base,
+                [next(teams) for _ in range(args.requests)],
+                args.concurrency,
+            )
+            elapsed = time.perf_counter() - started
+    finally:
+        server.terminate()
+        server.wait()
+    return args.requests / elapsed, latencies
+
+
+def cleanup(redis_manager: RedisManager, teams: int, players: set):
+    redis = redis_manager.client
+    keys = []
+    for team_id in range(FIRST_TEAM_ID, FIRST_TEAM_ID + teams):
+        keys += redis.keys(f"*{SEASON}-team:{team_id}:*")
+    for player_id in players:
+        keys += redis.keys(f"player:{player_id}:*")
+    for start in range(0, len(keys), 1000):
+        redis.delete(*keys[start : start + 1000])
+
+
+def parse_counts(value: str) -> list:
+    return [int(count) for count in value.split(",")]
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--workers",
+        type=parse_counts,
+        default=[n for n in (1, 2, 4, 8, 16) if n <= cpus] or [1],
+        help="Comma-separated WEB_CONCURRENCY values",
+    )
+    parser.add_argument(
+        "--pool-sizes",
+        type=parse_counts,
+        default=[0, 1, 2],
+        help="Comma-separated FEED_PROCESS_POOL_SIZE values",
+    )
+    parser.add_argument("--requests", type=int, default=16)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--games", type=int, default=20, help="Games per season")
+    args = parser.parse_args()
+
+    feed = build_feed(first_player_id=FIRST_PLAYER_ID)
+    players = {line["player_id"] for line in extract_player_lines(json.loads(feed))}
+    upstream_server = start_upstream(args.games, feed)
+    upstream = f"http://127.0.0.1:{upstream_server.server_address[1]}"
+    print(
+        f"{args.games} games per request, feed {len(feed) / 1_000_000:.1f} MB, "
+        f"{len(players)} players per feed, {cpus} CPUs"
+    )
+
+    # Every request in every run asks for a new team, so none is cached
+    teams = itertools.count(FIRST_TEAM_ID)
+    try:
+        for workers in args.workers:
+            for pool_size in args.pool_sizes:
+                rate, latencies = asyncio.run(
+                    measure(args, upstream, workers, pool_size, teams)
+                )
+                p95 = statistics.quantiles(latencies, n=20)[-1]
+                print(
+                    f"workers {workers:2d}, pool {pool_size:2d}: {rate:6.2f} req/s, "
+                    f"p50 {statistics.median(latencies):7.0f} ms, p95 {p95:7.0f} ms"
+                )
+    finally:
+        upstream_server.shutdown()
+        cleanup(RedisManager(), next(teams) - FIRST_TEAM_ID, players)
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("PYTHONWARNINGS", "ignore")
+    main()
@@ -0,0 +1,135 @@
+"""Feed decode throughput for increasing process pool sizes.
+
+Only decoding is measured, in a plain process pool in this process. For whole
+cold /games requests through Gunicorn workers and their feed pools, run
+benchmarks.cold_games.
+
+Usage: python -m benchmarks.feed_decode [--feeds 64] [--max-workers N]
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import asyncio
+import json
+import os
+import time
+
+from app.services.feed_processor import decode_game_enrichment
+
+
+def build_feed(
+    plays: int = 320, pitches_per_play: int = 24, first_player_id: int = 0
+) -> bytes:
+    """Build a synthetic GUMBO feed about the size of a real one (~1.5 MB).
+
+    Player IDs start after ``first_player_id``.
+    """
+    players = {
+        f"ID{team}{i}": {
+            "person": {
+                "id": first_player_id + team * 1000 + i,
+                "fullName": f"Player {team}-{i}",
+            },
+            "stats": {
+                # The first 13 of each roster bat, the last 10 pitch
+                "batting": {
+                    "plateAppearances": 4 if i < 13 else 0,
+                    "atBats": 4 if i < 13 else 0,
+                    "hits": i % 4,
+                    "rbi": i % 3,
+                    "homeRuns": i % 2,
+                },
+                "pitching": {
+                    "battersFaced": 5 if i >= 30 else 0,
+                    "inningsPitched": "1.0",
+                    "strikeOuts": i % 5,
+                },
+            },
+        }
+        for team in (1, 2)
+        for i in range(40)
+    }
+    all_plays = [
+        {
+            "about": {"inning": p // 36 + 1, "halfInning": "top", "isComplete": True},
+            "result": {
+                "event": ["Single", "Double", "Home Run", "Strikeout"][p % 4],
+                "description": "A fairly long play description " * 4,
+                "rbi": p % 3,
+            },
+            "matchup": {
+                "batter": {"id": first_player_id + p, "fullName": f"Batter {p}"},
+                "pitcher": {"id": first_player_id + p + 1, "fullName": f"Pitcher {p}"},
+            },
+            "playEvents": [
+                {
+                    "details": {"description": "Ball", "code": "B"},
+                    "pitchData": {
+                        "startSpeed": 93.4,
+                        "coordinates": {"x": 1.2, "y": 3.4, "pX": 0.1, "pZ": 2.5},
+                        "breaks": {"spinRate": 2300, "breakAngle": 12.0},
+                    },
+                }
+                for _ in range(pitches_per_play)
+            ],
+        }
+        for p in range(plays)
+    ]
+    feed = {
+        "metaData": {"timeStamp": "20240401_200000"},
+        "liveData": {
+            "plays": {"allPlays": all_plays},
+            "boxscore": {
+                "teams": {"away": {"players": players}, "home": {"players": players}}
+            },
+            "decisions": {
+                "winner": {"id": first_player_id + 1, "fullName": "Winning Pitcher"}
+            },
+        },
+    }
+    return json.dumps(feed).encode("utf-8")
+
+
+async def run(pool: ProcessPoolExecutor, raw: bytes, feeds: int) -> float:
+    loop = asyncio.get_running_loop()
+    # Warm the workers so process start-up is not measured
+    await asyncio.gather(
+        *[
+            loop.run_in_executor(pool, decode_game_enrichment, raw)
+            for _ in range(pool._max_workers)
+        ]
+    )
+    started = time.perf_counter()
+    await asyncio.gather(
+        *[loop.run_in_executor(pool, decode_game_enrichment, raw) for _ in range(feeds)]
+    )
+    return feeds / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--feeds", type=int, default=64)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    raw = build_feed()
+    print(f"feed size: {len(raw) / 1_000_000:.1f} MB, feeds per run: {args.feeds}")
+
+    started = time.perf_counter()
+    for _ in range(args.feeds):
+        decode_game_enrichment(raw)
+    inline = args.feeds / (time.perf_counter() - started)
+    print(f"inline (event loop): {inline:8.1f} feeds/s")
+
+    workers = 1
+    while workers <= args.max_workers:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            throughput = asyncio.run(run(pool, raw, args.feeds))
+        print(
+            f"pool of {workers:3d}:        {throughput:8.1f} feeds/s ({throughput / inline:.2f}x)"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Requests per second for cached /games hits, with and without the response cache.
+
+Seeds a synthetic season into the Redis from settings, then calls the ASGI app
+in-process on one core, so the numbers are per core and exclude the network.
+
+Usage: python -m benchmarks.response_cache [--requests 2000] [--per-page 100]
+"""
+
+from datetime import datetime, timedelta
+import argparse
+import asyncio
+import time
+
+from app.cache.redis_manager import RedisManager
+from app.config import settings, GameDetailLevel
+from app.models.game import (
+    Game,
+    GameEvent,
+    GameList,
+    GameScore,
+    GameStatus,
+    Team,
+)
+from app.queue.summary_queue import InMemorySummaryQueue
+from app.services.mlb_api import MLBAPIClient
+from main import app
+
+SEASON = 2010
+TEAM_ID = 990001  # Not a real team, so seeded keys never collide with real data
+FIRST_GAME_ID = 990000000
+
+
+def build_games(count: int) -> GameList:
+    """Build a season of finished games about the size of real enriched ones."""
+    games = [
+        Game(
+            id=FIRST_GAME_ID + i,
+            game_type="R",
+            date=datetime(SEASON, 4, 1) + timedelta(days=i),
+            status=GameStatus(
+                abstract_game_state="Final",
+                detailed_state="Final",
+                status_code="F",
+                is_final=True,
+            ),
+            teams={
+                "away": Team(id=TEAM_ID, name="Benchmark Visitors", abbreviation="BV"),
+                "home": Team(id=TEAM_ID + 1, name="Benchmark Hosts", abbreviation="BH"),
+            },
+            score=GameScore(away=i % 9, home=(i + 4) % 9),
+            venue="Benchmark Park",
+            away_hits=8,
+            home_hits=6,
+            away_errors=0,
+            home_errors=1,
+            top_performer="Benchmark Slugger",
+            winning_pitcher="Benchmark Ace",
+            events=[
+                GameEvent(
+                    inning=str(inning),
+                    title="Home Run",
+                    description="Benchmark Slugger homers on a fly ball to left field.",
+                )
+                for inning in range(1, 7)
+            ],
+        )
+        for i in range(count)
+    ]
+    return GameList(total_items=len(games), games=games)
+
+
+async def request(query: str, accept_encoding: str) -> int:
+    """Send one GET /games straight through the ASGI app; returns the body size."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": f"/api/{settings.API_VERSION}/games",
+        "raw_path": f"/api/{settings.API_VERSION}/games".encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [(b"accept-encoding", accept_encoding.encode())],
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8000),
+    }
+    size = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal size
+        if message["type"] == "http.response.start":
+            assert message["status"] == 200, message["status"]
+        elif message["type"] == "http.response.body":
+            size += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return size
+
+
+async def measure(query: str, accept_encoding: str, requests: int):
+    # The first request fills the response cache when it is enabled
+    size = await request(query, accept_encoding)
+    started = time.perf_counter()
+    for _ in range(requests):
+        await request(query, accept_encoding)
+    return requests / (time.perf_counter() - started), size
+
+
+async def run(args):
+    redis_manager = RedisManager()
+    games = build_games(args.games)
+    await redis_manager.set_games(games, SEASON, TEAM_ID, GameDetailLevel.ENRICHED)
+    await redis_manager.set_summaries(
+        games.games,
+        {
+            game.id: {"en": "Summary " * 12, "es": "Resumen " * 12, "ja": "要約" * 24}
+            for game in games.games
+        },
+    )
+    app.state.mlb_client = MLBAPIClient(InMemorySummaryQueue())
+    app.state.redis_manager = redis_manager
+
+    query = f"season={SEASON}&team_id={TEAM_ID}&per_page={args.per_page}"
+    try:
+        baseline = None
+        for enabled, accept_encoding in (
+            (False, "identity"),
+            (True, "identity"),
+            (True, "gzip"),
+            (True, "br, gzip"),
+        ):
+            settings.RESPONSE_CACHE_ENABLED = enabled
+            rate, size = await measure(query, accept_encoding, args.requests)
+            baseline = baseline or rate
+            label = "response cache" if enabled else "pydantic path "
+            print(
+                f"{label} {accept_encoding:>10}: {rate:8.1f} req/s "
+                f"({rate / baseline:5.2f}x), body {size / 1000:6.1f} kB"
+            )
+    finally:
+        await app.state.mlb_client.close()
+        keys = redis_manager.client.keys(f"*{SEASON}-team:{TEAM_ID}:*")
+        keys += [f"summary:{game.id}" for game in games.games]
+        redis_manager.client.delete(*keys)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--games", type=int, default=162)
+    parser.add_argument("--per-page", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Cold-start budget check: import time and time to first /health response.
+
+Usage: python -m benchmarks.startup [--budget-ms 1500] [--runs 3]
+Exits non-zero when the slowest run goes over budget.
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+IMPORT_SNIPPET = (
+    "import time; started = time.perf_counter(); import main; "
+    "print((time.perf_counter() - started) * 1000)"
+)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_import_ms() -> float:
+    output = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", IMPORT_SNIPPET],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def measure_first_health_ms(timeout: float = 30.0) -> float:
+    port = _free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                with urllib.request.urlopen(
+                    f"http://127.0.0.1:{port}/health", timeout=1
+                ) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - started) * 1000
+            except OSError:
+                time.sleep(0.01)
+        raise TimeoutError(f"/health did not answer within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--budget-ms", type=float, default=1500)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    import_times = [measure_import_ms() for _ in range(args.runs)]
+    health_times = [measure_first_health_ms() for _ in range(args.runs)]
+
+    print(f"import main:        {' '.join(f'{t:7.0f}' for t in import_times)} ms")
+    print(f"first /health:      {' '.join(f'{t:7.0f}' for t in health_times)} ms")
+
+    worst = max(health_times)
+    if worst > args.budget_ms:
+        print(
+            f"FAIL: slowest cold start {worst:.0f} ms > budget {args.budget_ms:.0f} ms"
+        )
+        sys.exit(1)
+    print(f"OK: slowest cold start {worst:.0f} ms <= budget {args.budget_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("PYTHONWARNINGS", "ignore")
+    main()
@@ -0,0 +1,12 @@
+import os
+from app.config import settings
+
+bind = f":{settings.PORT}"
+# os.cpu_count() reports host CPUs on Cloud Run, not the vCPU limit, so set
+# WEB_CONCURRENCY there explicitly
+workers = settings.WEB_CONCURRENCY or os.cpu_count() or 1
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Import the app and its heavy dependencies once in the master so forked
+# workers share those pages copy-on-write instead of re-importing them.
+preload_app = settings.PRELOAD_APP
@@ -1,7 +1,29 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
 from app.api.v1.games import router as games_router
+from app.api.v1.players import router as players_router
+from app.cache.redis_manager import RedisManager
+from app.services.feed_processor import shutdown_feed_pool
+from app.services.mlb_api import MLBAPIClient
+from app.services.summary_worker import SummaryWorker
+from app.queue.summary_queue import create_summary_queue
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Built per worker after fork; SDK clients inside are created on first use
+    summary_queue = create_summary_queue()
+    app.state.mlb_client = MLBAPIClient(summary_queue)
+    app.state.redis_manager = RedisManager()
+    app.state.summary_worker = SummaryWorker(summary_queue)
+    app.state.summary_worker.start()
+    yield
+    await app.state.summary_worker.stop()
+    await app.state.mlb_client.close()
+    shutdown_feed_pool()
+
 
 app = FastAPI(
     title="MLB Quick Recap API",
@@ -9,6 +31,7 @@ app = FastAPI(
     version=settings.API_VERSION,
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -22,6 +45,9 @@ app.add_middleware(
 
 # Include API routers
 app.include_router(games_router, prefix=f"/api/{settings.API_VERSION}", tags=["games"])
+app.include_router(
+    players_router, prefix=f"/api/{settings.API_VERSION}", tags=["players"]
+)
 
 
 @app.get("/health")